@@ -1,113 +1,162 @@
 import glob
 import json
 import os
-from datetime import date, datetime, timezone
+from pathlib import Path
 from typing import Union
 
 import altair as alt
 import polars as pl
-import pytz
 import streamlit as st
-
-from coin_data.config import PUMPFUN_DATA_DIR, PUMPFUN_RESULTS_PATTERN
+from streamlit_autorefresh import st_autorefresh
+
+from coin_data.app.display import display_frame
+from coin_data.app.query import (
+    PAGE_SIZE,
+    SORT_COLUMNS,
+    ResultsQuery,
+    apply_query,
+    count_rows,
+    dataset_version,
+    fetch_page,
+    file_version,
+    scan_all_days,
+)
+from coin_data.app.search import SEARCH_COLUMNS, SearchIndex
+from coin_data.app.tail import ResultsTail
+from coin_data.config import (
+    PUMPFUN_DATA_DIR,
+    PUMPFUN_PARQUET_RESULTS_PATTERN,
+    PUMPFUN_RESULTS_PATTERN,
+)
+from coin_data.exchanges.pumpfun.cohorts import load_cohorts
+from coin_data.exchanges.pumpfun.sinks import read_results
+from coin_data.exchanges.pumpfun.summary import load_summary
+from coin_data.exchanges.pumpfun.universe import UniverseReader
 
 data_dir = PUMPFUN_DATA_DIR
-file_pattern = PUMPFUN_RESULTS_PATTERN
+file_patterns = (PUMPFUN_RESULTS_PATTERN, PUMPFUN_PARQUET_RESULTS_PATTERN)
+# How often each session checks for new or updated results files
+refresh_check_seconds = 30
+# How often the live view polls the newest results file
+live_refresh_ms = 5000
 
 
 def get_csv_files():
-    return sorted(glob.glob(os.path.expanduser(os.path.join(data_dir, file_pattern))))
+    """One results file per day, preferring Parquet over its CSV export."""
+    files: dict[str, str] = {}
+    for file_pattern in file_patterns:
+        for f in glob.glob(os.path.expanduser(os.path.join(data_dir, file_pattern))):
+            files[Path(f).stem] = f
+    return sorted(files.values())
 
 
-@st.cache_data  # type: ignore
-def load_data(file_path: str) -> pl.DataFrame:
-    """Loads CSV data with caching, but will be cleared on refresh."""
+@st.cache_resource  # type: ignore
+def get_universe_reader() -> UniverseReader:
+    """One memory-mapped universe per process, shared by every session."""
+    return UniverseReader()
+
+
+@st.cache_data(max_entries=64)  # type: ignore
+def load_file_data(
+    file_path: str, version: str, columns: list[str] | None = None
+) -> pl.DataFrame:
+    """Loads results data, cached per file version so only changed files reload."""
     df = pl.DataFrame()
     try:
-        df = pl.read_csv(file_path)
-    except pl.exceptions.NoDataError as e:
+        df = read_results(Path(file_path), columns)
+    except pl.exceptions.PolarsError as e:
         st.error(f"Error loading data: {e}")
     return df
 
 
-@st.cache_data  # type: ignore
+def load_data(file_path: str, columns: list[str] | None = None) -> pl.DataFrame:
+    """Reads the day from the shared universe, falling back to its file."""
+    df = get_universe_reader().results_for(Path(file_path))
+    if df is None:
+        return load_file_data(file_path, file_version(file_path), columns)
+    return df.select(columns) if columns else df
+
+
 def build_graduated_tokens_data() -> pl.DataFrame:
     """Return a Polars DataFrame with columns:
-    date, daily_count, cumulative_count
+    date, daily_count, cumulative_count, total_market_cap, ...
+
+    Read from the summary the scraper maintains, so no results file is opened.
     """
-    files = get_csv_files()
-    data: list[dict[str, date | int]] = []
+    return load_summary().rename({"rows": "daily_count"})
 
-    for f in files:
-        # Extract date from filename: "results_YYYY-MM-DD.csv"
-        file_date_str = os.path.basename(f).replace("results_", "").replace(".csv", "")
-        # Convert string to a date object
-        file_date = datetime.strptime(file_date_str, "%Y-%m-%d").date()
 
-        # Load the CSV
-        df_f = load_data(f)
-        daily_count = df_f.height  # number of rows
+@st.cache_resource  # type: ignore
+def get_results_tail(file_path: str) -> ResultsTail:
+    """One tail per results file, shared by every live session."""
+    return ResultsTail(Path(file_path))
 
-        data.append({"date": file_date, "daily_count": daily_count})
 
-    # Build a Polars DataFrame and sort by date
-    df_chart = pl.DataFrame(data).sort("date")
+def source_frame(file_path: str | None, live: bool = False) -> pl.LazyFrame:
+    """The tailed file when `live`, the selected day, or every day for `None`."""
+    if file_path is None:
+        return scan_all_days()
+    if live:
+        return get_results_tail(file_path).frame.lazy()
+    return load_data(file_path).lazy()
 
-    # Compute the cumulative sum of daily_count
-    df_chart = df_chart.with_columns(
-        (pl.col("daily_count").cum_sum()).alias("cumulative_count")
-    )
 
-    return df_chart
+@st.cache_resource(max_entries=4)  # type: ignore
+def get_search_index(
+    file_path: str | None, version: str, live: bool = False
+) -> SearchIndex:
+    """Built once per file version; `None` indexes every day."""
+    return SearchIndex(source_frame(file_path, live).select(SEARCH_COLUMNS).collect())
 
 
-def search_filter(df: pl.DataFrame, query: str) -> pl.DataFrame:
-    """Filters the dataframe based on a search query."""
-    if not query.strip():
-        return df
-    df_str = df.with_columns(pl.all().cast(pl.Utf8).fill_null(""))
-    combined = df_str.with_columns(
-        pl.concat_str(pl.all(), separator=" ").alias("combined")
-    )
-    mask = combined["combined"].str.contains(query, literal=False, strict=False)
-    return df.filter(mask)
-
-
-def market_cap_filter(df: pl.DataFrame, operator: str, value: float) -> pl.DataFrame:
-    """Filters the dataframe based on the market cap operator and value."""
-    if operator not in [">", "<"] or "current_market_cap" not in df.columns:
-        return df
-    return df.filter(
-        df["current_market_cap"] > value
-        if operator == ">"
-        else df["current_market_cap"] < value
-    )
+def query_frame(
+    file_path: str | None, version: str, query: ResultsQuery, live: bool = False
+) -> pl.LazyFrame:
+    """The rows of `source_frame` that match `query`."""
+    index = get_search_index(file_path, version, live) if query.search.strip() else None
+    return apply_query(source_frame(file_path, live), query, index)
 
 
-def convert_to_est(timestamp: int | float) -> str:
-    """Converts a timestamp to EST timezone in 12-hour format."""
-    est = pytz.timezone("America/New_York")
-    dt = (
-        datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc)
-        .replace(tzinfo=pytz.utc)
-        .astimezone(est)
-    )
-    return dt.strftime("%B %d, %Y %I:%M %p %Z")
+@st.cache_data(max_entries=256)  # type: ignore
+def count_matches(
+    file_path: str | None, version: str, query: ResultsQuery, live: bool = False
+) -> int:
+    """Matching rows; `version` keys the cache."""
+    return count_rows(query_frame(file_path, version, query, live))
+
+
+@st.cache_data(max_entries=256)  # type: ignore
+def load_page(
+    file_path: str | None,
+    version: str,
+    query: ResultsQuery,
+    page: int,
+    live: bool = False,
+) -> pl.DataFrame:
+    """One page of matching rows with image URIs and EST times ready to render."""
+    return display_frame(fetch_page(query_frame(file_path, version, query, live), page))
 
 
 # Streamlit UI
 st.set_page_config(layout="wide")
 st.title("Coin Data")
 
-# Button to manually refresh the data
+# Button to manually refresh the data. Caches are keyed by file version, so
+# a rerun reloads only the files that changed.
 if st.button("Refresh Data"):
-    st.cache_data.clear()  # Clear cached data
+    st.rerun()
 
-    # Clear session state to reset UI elements
-    for key in st.session_state.keys():
-        del st.session_state[key]
 
-    st.rerun()
+@st.fragment(run_every=refresh_check_seconds)  # type: ignore
+def watch_results_files() -> None:
+    """Rerun the page when a results file is added or changed."""
+    version = dataset_version()
+    if st.session_state.setdefault("dataset_version", version) != version:
+        st.session_state["dataset_version"] = version
+        st.rerun(scope="app")
+
+
+watch_results_files()
 
 
 # Get available files
@@ -125,12 +174,13 @@ if "selected_file" not in st.session_state:
 # Dropdown to select file (resets properly)
 selected_file = st.selectbox("Select a CSV file:", csv_files, key="selected_file")
 
-# Load and display data
-df = load_data(selected_file)
+# Query every day at once instead of the selected file
+all_days = st.toggle("All days", key="all_days")
 
-
-# Display number of rows
-st.write(f"Total graduated tokens with metadata on pump.fun: {df.height}")  # type: ignore
+# Follow the newest results file while the scraper writes it
+live = st.toggle("Live", key="live")
+if live:
+    st_autorefresh(interval=live_refresh_ms, key="live_refresh")
 
 # Search Box for general filtering
 search_query = st.text_input("Search:", "")
@@ -148,46 +198,52 @@ with col2:
         "Value", min_value=0.0, value=0.0, step=1e6, key="market_cap_val"
     )
 
-# Load and filter data
-df_filtered = search_filter(df, search_query)
-
-if market_cap_operator is not None:
-    df_filtered = market_cap_filter(df_filtered, market_cap_operator, market_cap_value)
-
-# Modify Image URIs to use Pinata Gateway
-df_filtered = df_filtered.with_columns(
-    pl.col("image_uri").str.replace(
-        "https://ipfs.io/ipfs/", "https://pump.mypinata.cloud/ipfs/"
-    )
+# Sorting and paging happen here; only the current page reaches the browser
+sort_col, order_col, page_col = st.columns([2, 1, 1])
+with sort_col:
+    sort_by = st.selectbox("Sort by", [None, *SORT_COLUMNS], key="sort_by")
+with order_col:
+    descending = st.checkbox("Descending", value=True, key="descending")
+
+query = ResultsQuery(
+    search=search_query,
+    market_cap_operator=market_cap_operator,
+    market_cap_value=market_cap_value,
+    sort_by=sort_by,
+    descending=descending,
 )
+if live:
+    # Only the rows appended since the last poll are read
+    file_path = csv_files[-1]
+    tail = get_results_tail(file_path)
+    tail.poll()
+    version = tail.version
+else:
+    file_path = None if all_days else selected_file
+    version = dataset_version() if all_days else file_version(selected_file)
+
+total_rows = count_matches(file_path, version, ResultsQuery(), live)
+if live:
+    st.write(f"Live: {total_rows} graduated tokens in {Path(file_path).name}")
+elif all_days:
+    st.write(f"Graduated tokens across all days: {total_rows}")
+else:
+    st.write(f"Total graduated tokens with metadata on pump.fun: {total_rows}")
 
-# Append ?img-width=128&img-height=128 to the image URI
-df_filtered = df_filtered.with_columns(
-    pl.col("image_uri").map_elements(
-        lambda url: (
-            f"{url}?img-width=258&img-height=258" if isinstance(url, str) else ""
-        ),
-        return_dtype=pl.Utf8,
-    )
-)
+matching_rows = count_matches(file_path, version, query, live)
+page_count = max(1, -(-matching_rows // PAGE_SIZE))
+# Back to the last page when a narrower filter leaves fewer pages
+st.session_state["page"] = min(st.session_state.get("page", 1), page_count)
 
-# Ensure image_uri contains direct image URLs
-df_filtered = df_filtered.with_columns(
-    pl.col("image_uri").map_elements(
-        lambda url: url if isinstance(url, str) else "", return_dtype=pl.Utf8
-    )
-)
+with page_col:
+    page = st.number_input("Page", min_value=1, max_value=page_count, key="page")
+st.caption(f"{matching_rows} matching tokens, page {page} of {page_count}")
 
-# Convert created_timestamp to EST
-df_filtered = df_filtered.with_columns(
-    pl.col("created_timestamp").map_elements(
-        lambda ts: convert_to_est(ts) if isinstance(ts, (int, float)) else "",
-        return_dtype=pl.Utf8,
-    )
-)
+df_filtered = load_page(file_path, version, query, page - 1, live)
 
 # Custom column headers
 column_headers = {
+    "date": "Date",
     "name": "Token Name",
     "symbol": "Symbol",
     "mint": "Mint Address",
@@ -207,7 +263,7 @@ column_headers = {
 }
 
 # Rename columns
-df_filtered = df_filtered.rename(column_headers)
+df_filtered = df_filtered.rename(column_headers, strict=False)
 
 # Exclude Raydium Pool column from display
 display_columns = [col for col in df_filtered.columns if col.lower() != "raydium_pool"]
@@ -262,9 +318,7 @@ st.data_editor(
 
 def load_ai_report(selected_file: str):
     """Loads AI-generated market analysis from JSON matching the selected CSV file date."""
-    report_date = (
-        os.path.basename(selected_file).replace("results_", "").replace(".csv", "")
-    )
+    report_date = Path(selected_file).stem.replace("results_", "")
     report_path = os.path.join(
         PUMPFUN_DATA_DIR, "reports", f"report_{report_date}.json"
     )
@@ -341,6 +395,14 @@ else:
 # Build daily/cumulative data
 df_chart = build_graduated_tokens_data()
 
+# Overview across every scraped day
+overview_cols = st.columns(3)
+overview_cols[0].metric("Days Scraped", df_chart.height)
+overview_cols[1].metric("Graduated Tokens", int(df_chart["daily_count"].sum()))
+overview_cols[2].metric(
+    "Total Current Market Cap ($)", f"{df_chart['total_market_cap'].sum():,.0f}"
+)
+
 # Convert to Pandas for Altair
 df_chart_pd = df_chart.to_pandas()
 
@@ -371,5 +433,80 @@ combined_chart = (
     .properties(width="container", height=400)
 )
 
-st.subheader("Daily & Cumulative Graduated Tokens")
-st.altair_chart(combined_chart, use_container_width=True)
+graduated_tab, cohorts_tab = st.tabs(["Graduated Tokens", "Cohorts"])
+
+with graduated_tab:
+    st.subheader("Daily & Cumulative Graduated Tokens")
+    st.altair_chart(combined_chart, use_container_width=True)
+
+# Cohort analytics are precomputed per graduation day by the scraper
+with cohorts_tab:
+    cohorts = load_cohorts()
+    df_cohorts = cohorts.frame()
+
+    if df_cohorts.is_empty():
+        st.info("No cohort analytics yet. They are computed as results are written.")
+    else:
+        threshold = st.selectbox(
+            "Still above market cap ($)",
+            cohorts.thresholds,
+            format_func=lambda value: f"{value:,}",
+            key="cohort_threshold",
+        )
+
+        share_chart = (
+            alt.Chart(df_cohorts.to_pandas())  # type: ignore
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("date:T", title="Graduation Day"),
+                y=alt.Y(
+                    f"share_above_{threshold}:Q",
+                    title="Share Above Market Cap",
+                    axis=alt.Axis(format="%"),
+                ),
+            )
+            .properties(width="container", height=300)
+        )
+        st.subheader("Share of Each Day's Graduates Still Above the Market Cap")
+        st.altair_chart(share_chart, use_container_width=True)
+
+        peak_chart = (
+            alt.Chart(df_cohorts.to_pandas())  # type: ignore
+            .mark_bar(color="steelblue")
+            .encode(
+                x=alt.X("date:T", title="Graduation Day"),
+                y=alt.Y("median_hours_to_peak:Q", title="Median Hours to Peak"),
+            )
+            .properties(width="container", height=300)
+        )
+        st.subheader("Median Time to Peak Market Cap")
+        st.altair_chart(peak_chart, use_container_width=True)
+
+        cohort_days = df_cohorts["date"].to_list()
+        selected_days = st.multiselect(
+            "Cohorts",
+            cohort_days,
+            default=cohort_days[-7:],
+            key="survival_cohorts",
+        )
+        df_survival = (
+            cohorts.survival_frame()
+            .filter(pl.col("date").is_in(selected_days))
+            .with_columns(pl.col("date").cast(pl.Utf8))
+        )
+        survival_chart = (
+            alt.Chart(df_survival.to_pandas())  # type: ignore
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("hours:Q", title="Hours Since Creation"),
+                y=alt.Y(
+                    "survival:Q",
+                    title="Share Not Yet Peaked",
+                    axis=alt.Axis(format="%"),
+                ),
+                color=alt.Color("date:N", title="Graduation Day"),
+            )
+            .properties(width="container", height=300)
+        )
+        st.subheader("Survival Curves (Share of Tokens Not Yet at Their Peak)")
+        st.altair_chart(survival_chart, use_container_width=True)
@@ -0,0 +1,80 @@
+import re
+
+import polars as pl
+
+from coin_data.config import THUMBNAIL_SERVICE_URL, THUMBNAIL_SIZE
+from coin_data.exchanges.pumpfun.constants import (
+    IPFS_GATEWAY_URL,
+    IPFS_PATH_PATTERN,
+    PINATA_GATEWAY_URL,
+)
+
+DISPLAY_TIME_ZONE = "America/New_York"
+DISPLAY_TIME_FORMAT = "%B %d, %Y %I:%M %p %Z"
+IMAGE_QUERY = f"?img-width={THUMBNAIL_SIZE}&img-height={THUMBNAIL_SIZE}"
+# Characters that would end or split a query parameter value; "%" goes first
+QUERY_ESCAPES = {"%": "%25", " ": "%20", "#": "%23", "&": "%26", "+": "%2B", "?": "%3F"}
+# URIs the thumbnail service accepts: see `ipfs_path` in coin_data.server.thumbnails
+THUMBNAIL_URI_PATTERN = (
+    f"^(?:{re.escape(IPFS_GATEWAY_URL)}|{re.escape(PINATA_GATEWAY_URL)})"
+    f"{IPFS_PATH_PATTERN}(?s:[?#].*)?$"
+)
+
+
+def quote_expr(expr: pl.Expr) -> pl.Expr:
+    """Percent-encode a URL for use as a query parameter value."""
+    for char, escape in QUERY_ESCAPES.items():
+        expr = expr.str.replace_all(char, escape, literal=True)
+    return expr
+
+
+def image_uri_expr(
+    column: str = "image_uri", service_url: str = THUMBNAIL_SERVICE_URL
+) -> pl.Expr:
+    """
+    Serve IPFS images from the API's thumbnail cache when `service_url` is
+    set, and every other image through the Pinata gateway at thumbnail size.
+    """
+    uri = (
+        pl.col(column).str.replace(IPFS_GATEWAY_URL, PINATA_GATEWAY_URL, literal=True)
+        + IMAGE_QUERY
+    )
+    if service_url:
+        uri = (
+            pl.when(pl.col(column).str.contains(THUMBNAIL_URI_PATTERN))
+            .then(
+                f"{service_url}/thumbnails?size={THUMBNAIL_SIZE}&uri="
+                + quote_expr(pl.col(column))
+            )
+            .otherwise(uri)
+        )
+
+    return (
+        pl.when(pl.col(column).is_not_null())
+        .then(uri)
+        .otherwise(pl.lit(""))
+        .alias(column)
+    )
+
+
+def est_time_expr(column: str) -> pl.Expr:
+    """Epoch milliseconds -> "January 31, 2025 09:30 PM EST"."""
+    return (
+        pl.from_epoch(pl.col(column).cast(pl.Int64, strict=False), time_unit="ms")
+        .dt.replace_time_zone("UTC")
+        .dt.convert_time_zone(DISPLAY_TIME_ZONE)
+        .dt.strftime(DISPLAY_TIME_FORMAT)
+        .fill_null("")
+        .alias(column)
+    )
+
+
+def display_frame(df: pl.DataFrame) -> pl.DataFrame:
+    """Apply every display transform to a results frame in one pass."""
+    transforms: list[pl.Expr] = []
+    if "image_uri" in df.columns:
+        transforms.append(image_uri_expr())
+    if "created_timestamp" in df.columns:
+        transforms.append(est_time_expr("created_timestamp"))
+
+    return df.with_columns(transforms) if transforms else df
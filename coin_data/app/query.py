@@ -0,0 +1,110 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.app.search import SearchIndex
+from coin_data.config import (
+    PUMPFUN_COMPACTED_DIR,
+    PUMPFUN_DATA_DIR,
+    PUMPFUN_UNIVERSE_PATH,
+)
+from coin_data.exchanges.pumpfun.compaction import scan_results
+from coin_data.exchanges.pumpfun.sinks import results_files, source_signature
+from coin_data.exchanges.pumpfun.universe import (
+    scan_universe,
+    universe_is_current,
+)
+
+PAGE_SIZE = 100
+SORT_COLUMNS = [
+    "date",
+    "created_timestamp",
+    "volume",
+    "holder_count",
+    "highest_market_cap",
+    "lowest_market_cap",
+    "current_market_cap",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ResultsQuery:
+    """Filters and ordering for the all-days table."""
+
+    search: str = ""
+    market_cap_operator: str | None = None
+    market_cap_value: float = 0.0
+    sort_by: str | None = None
+    descending: bool = True
+
+
+def dataset_version(data_dir: Path = PUMPFUN_DATA_DIR) -> str:
+    """Changes whenever any results file does; use it in cache keys."""
+    return json.dumps(source_signature(results_files(data_dir)), sort_keys=True)
+
+
+def file_version(file_path: str) -> str:
+    """Changes whenever the results file does; use it in cache keys."""
+    return json.dumps(source_signature([Path(file_path)]))
+
+
+def scan_all_days(
+    data_dir: Path = PUMPFUN_DATA_DIR,
+    universe_path: Path = PUMPFUN_UNIVERSE_PATH,
+    compacted_dir: Path = PUMPFUN_COMPACTED_DIR,
+) -> pl.LazyFrame:
+    """
+    Every day's results with a `date` column. The memory-mapped universe is
+    scanned when it is current; otherwise the compacted monthly partitions
+    are, with daily files for months they don't cover.
+    """
+    if universe_is_current(data_dir, universe_path):
+        return scan_universe(universe_path)
+
+    return scan_results(data_dir=data_dir, output_dir=compacted_dir)
+
+
+def apply_query(
+    frame: pl.LazyFrame, query: ResultsQuery, index: SearchIndex | None = None
+) -> pl.LazyFrame:
+    """
+    Search, market-cap filter and sort, left for Polars to push down. The
+    search goes through `index` when one is given.
+    """
+    if query.search.strip() and index is not None:
+        frame = frame.filter(index.matches(query.search))
+    elif query.search.strip():
+        frame = frame.filter(
+            pl.concat_str(
+                pl.all().cast(pl.Utf8).fill_null(""), separator=" "
+            ).str.contains(query.search, literal=False, strict=False)
+        )
+
+    if query.market_cap_operator == ">":
+        frame = frame.filter(pl.col("current_market_cap") > query.market_cap_value)
+    elif query.market_cap_operator == "<":
+        frame = frame.filter(pl.col("current_market_cap") < query.market_cap_value)
+
+    # A single day has no `date` column to sort on
+    if query.sort_by is not None and query.sort_by in frame.collect_schema():
+        frame = frame.sort(query.sort_by, descending=query.descending, nulls_last=True)
+
+    return frame
+
+
+def count_rows(frame: pl.LazyFrame) -> int:
+    return frame.select(pl.len()).collect().item()
+
+
+def fetch_page(
+    frame: pl.LazyFrame,
+    page: int,
+    page_size: int = PAGE_SIZE,
+    columns: list[str] | None = None,
+) -> pl.DataFrame:
+    """Materialize one zero-based page, reading only `columns` when given."""
+    if columns is not None:
+        frame = frame.select(columns)
+    return frame.slice(page * page_size, page_size).collect()
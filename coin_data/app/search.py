@@ -0,0 +1,99 @@
+import polars as pl
+
+# Columns the search box matches against
+SEARCH_COLUMNS = ["name", "symbol", "mint", "telegram", "twitter", "website"]
+NGRAM_SIZE = 3
+
+
+class SearchIndex:
+    """
+    Trigram index over the searchable columns of a results frame.
+
+    A query is reduced to the rows holding every one of its trigrams, and
+    only those rows are checked for the full substring. Exact mint lookups
+    go through a dict. Matching is case-insensitive and literal.
+    """
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        columns = [column for column in SEARCH_COLUMNS if column in frame.columns]
+        self.mints: pl.Series = frame["mint"].cast(pl.Utf8)
+        # Fields are joined with a newline, which no query can span
+        self.text: pl.Series = frame.select(
+            pl.concat_str(
+                [pl.col(column).cast(pl.Utf8).fill_null("") for column in columns],
+                separator="\n",
+            ).str.to_lowercase()
+        ).to_series()
+
+        self.rows_by_mint: dict[str, list[int]] = {}
+        for row, mint in enumerate(self.mints):
+            if mint:
+                self.rows_by_mint.setdefault(mint, []).append(row)
+
+        grams = (
+            pl.DataFrame({"text": self.text})
+            .with_row_index("row")
+            .with_columns(
+                pl.int_ranges(
+                    0, (pl.col("text").str.len_chars() - NGRAM_SIZE + 1).clip(0)
+                ).alias("offset")
+            )
+            .explode("offset")
+            .drop_nulls("offset")
+            .select(
+                "row",
+                pl.col("text").str.slice(pl.col("offset"), NGRAM_SIZE).alias("gram"),
+            )
+            .group_by("gram")
+            .agg(pl.col("row").unique())
+        )
+
+        # Posting lists are slices of one flat series of row numbers
+        self.rows: pl.Series = grams["row"].explode()
+        lengths = grams["row"].list.len()
+        self.postings: dict[str, tuple[int, int]] = {
+            gram: (end - length, length)
+            for gram, length, end in zip(grams["gram"], lengths, lengths.cum_sum())
+        }
+
+    def __len__(self) -> int:
+        return self.mints.len()
+
+    def posting(self, gram: str) -> pl.Series:
+        offset, length = self.postings.get(gram, (0, 0))
+        return self.rows.slice(offset, length)
+
+    def search_rows(self, query: str) -> pl.Series:
+        """Sorted numbers of the rows matching `query`."""
+        exact = self.rows_by_mint.get(query.strip())
+        if exact is not None:
+            return pl.Series("row", exact, dtype=pl.UInt32)
+
+        needle = query.strip().lower()
+        if len(needle) < NGRAM_SIZE:
+            candidates = pl.int_range(len(self), dtype=pl.UInt32, eager=True)
+        else:
+            grams = {
+                needle[i : i + NGRAM_SIZE] for i in range(len(needle) - NGRAM_SIZE + 1)
+            }
+            postings = sorted((self.posting(gram) for gram in grams), key=len)
+            candidates = postings[0]
+            for posting in postings[1:]:
+                if candidates.is_empty():
+                    break
+                candidates = candidates.filter(candidates.is_in(posting))
+
+        if candidates.is_empty():
+            return candidates
+
+        return candidates.filter(
+            self.text.gather(candidates).str.contains(needle, literal=True)
+        )
+
+    def search(self, query: str) -> pl.Series:
+        """Mints of the rows matching `query`."""
+        return self.mints.gather(self.search_rows(query))
+
+    def matches(self, query: str) -> pl.Expr:
+        """Filter expression for the rows matching `query`."""
+        return pl.col("mint").is_in(self.search(query))
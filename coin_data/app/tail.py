@@ -0,0 +1,129 @@
+import threading
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.exchanges.pumpfun.sinks import (
+    RESULTS_COLUMNS,
+    RESULTS_SCHEMA,
+    read_results,
+    results_parts,
+)
+
+
+class ResultsTail:
+    """
+    Follows a results file while the scraper writes it, reading only what
+    was added since the last poll.
+
+    CSV sinks append rows, so the tail resumes from a byte offset and parses
+    complete lines only. Parquet sinks commit row groups as part files and
+    later merge them, in order, into the day's file, so the tail reads the
+    file followed by its parts from a row offset. A file that shrank, or a
+    CSV that was replaced, is read again from the start.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.frame = pl.DataFrame(schema=RESULTS_SCHEMA)
+        # Byte offset into a CSV, or rows read from a Parquet file
+        self.offset = 0
+        self.header = b""
+        self.inode: int | None = None
+        # Bumped on every full re-read, so cache keys change with it
+        self.generation = 0
+
+    @property
+    def version(self) -> str:
+        return f"{self.generation}:{self.frame.height}"
+
+    def reset(self) -> None:
+        self.frame = pl.DataFrame(schema=RESULTS_SCHEMA)
+        self.offset = 0
+        self.header = b""
+        self.generation += 1
+
+    def poll(self) -> int:
+        """Merge any new rows into `frame`; returns how many were added."""
+        with self.lock:
+            if self.path.suffix == ".parquet":
+                rows = self.read_parquet()
+            else:
+                try:
+                    stat = self.path.stat()
+                except FileNotFoundError:
+                    return 0
+
+                if self.inode is not None and (
+                    stat.st_ino != self.inode or stat.st_size < self.offset
+                ):
+                    self.reset()
+                self.inode = stat.st_ino
+                rows = self.read_csv()
+
+            if rows.height:
+                self.frame = pl.concat([self.frame, rows])
+            return rows.height
+
+    def read_parquet(self) -> pl.DataFrame:
+        paths = [self.path] if self.path.exists() else []
+        paths += results_parts(self.path)
+        try:
+            counts = [
+                pl.scan_parquet(path).select(pl.len()).collect().item()
+                for path in paths
+            ]
+        except (FileNotFoundError, pl.exceptions.PolarsError):
+            # Parts were merged between listing and reading; retry next poll
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+
+        row_count = sum(counts)
+        if row_count < self.offset:
+            self.reset()
+        if row_count == self.offset:
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+
+        # Skip whole files that were already read
+        skip = self.offset
+        frames: list[pl.DataFrame] = []
+        try:
+            for path, count in zip(paths, counts):
+                if skip >= count:
+                    skip -= count
+                    continue
+                frames.append(read_results(path).slice(skip))
+                skip = 0
+        except (FileNotFoundError, pl.exceptions.PolarsError):
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+
+        self.offset = row_count
+        return pl.concat(frames)
+
+    def read_csv(self) -> pl.DataFrame:
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+
+        # A row still being written has no newline yet; leave it for later
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+        data = data[:end]
+
+        if not self.header:
+            header_end = data.index(b"\n") + 1
+            self.header, data = data[:header_end], data[header_end:]
+            self.offset += header_end
+
+        if not data.strip():
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+
+        try:
+            rows = pl.read_csv(self.header + data, infer_schema=False)
+        except pl.exceptions.PolarsError:
+            return pl.DataFrame(schema=RESULTS_SCHEMA)
+
+        self.offset += len(data)
+        # Same placeholder handling as `read_results`
+        return rows.select(RESULTS_COLUMNS).cast(RESULTS_SCHEMA, strict=False)
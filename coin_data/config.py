@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from coin_data.proxies import PROXIES
@@ -8,3 +9,32 @@ PROXIES_ENABLED = bool(PROXIES)
 # Data directory and file pattern
 PUMPFUN_DATA_DIR = Path.home() / "pumpfun_data"
 PUMPFUN_RESULTS_PATTERN = "results_*.csv"
+PUMPFUN_PARQUET_RESULTS_PATTERN = "results_*.parquet"
+PUMPFUN_ACTIVITIES_PATTERN = "activities_*.csv"
+
+# Every results row in one memory-mappable Arrow IPC file
+PUMPFUN_UNIVERSE_PATH = PUMPFUN_DATA_DIR / "universe.arrow"
+
+# Per-day row counts and market-cap stats for the dashboard overview
+PUMPFUN_SUMMARY_PATH = PUMPFUN_DATA_DIR / "summary.json"
+# Per-graduation-day cohort analytics, recomputed only for changed days
+PUMPFUN_COHORTS_PATH = PUMPFUN_DATA_DIR / "cohorts.json"
+
+# Monthly partitions merged from the daily files
+PUMPFUN_COMPACTED_DIR = PUMPFUN_DATA_DIR / "compacted"
+PUMPFUN_COMPACTION_MANIFEST_PATH = PUMPFUN_COMPACTED_DIR / "manifest.json"
+
+# Every mint processed on any day, for cross-day deduplication
+PUMPFUN_MINT_INDEX_PATH = PUMPFUN_DATA_DIR / "mint_index.sqlite"
+
+# Persistent caches shared between scraper runs
+PUMPFUN_CACHE_DIR = PUMPFUN_DATA_DIR / "cache"
+PUMPFUN_IDENTITY_CACHE_PATH = PUMPFUN_CACHE_DIR / "identity.sqlite"
+PUMPFUN_MARKET_CAP_STATE_PATH = PUMPFUN_CACHE_DIR / "market_cap_state.sqlite"
+
+# Token image thumbnails, fetched once and served by the API
+THUMBNAIL_SIZE = 258
+THUMBNAIL_CACHE_DIR = PUMPFUN_CACHE_DIR / "thumbnails"
+THUMBNAIL_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Base URL of the API as dashboard viewers reach it; unset, images load from IPFS
+THUMBNAIL_SERVICE_URL = os.getenv("THUMBNAIL_SERVICE_URL", "").rstrip("/")
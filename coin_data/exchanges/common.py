@@ -1,15 +1,48 @@
+import copy
 import dataclasses
-from dataclasses import MISSING, dataclass
+from dataclasses import MISSING
 from typing import Any
 
+# Built once per class: field defaults and the default instance itself
+_FIELD_DEFAULTS: dict[type, dict[str, Any]] = {}
+_DEFAULT_INSTANCES: dict[type, Any] = {}
+
 
-@dataclass
 class DefaultMixin:
+    __slots__ = ()
+
+    @classmethod
+    def field_defaults(cls) -> dict[str, Any]:
+        defaults = _FIELD_DEFAULTS.get(cls)
+        if defaults is None:
+            defaults = _FIELD_DEFAULTS[cls] = {
+                f.name: (f.default if f.default != MISSING else None)
+                for f in dataclasses.fields(cls)  # type: ignore[arg-type]
+            }
+
+        return defaults
+
     @classmethod
     def default(cls):
+        """
+        Return the default instance. Frozen classes share one cached instance;
+        mutable ones get a shallow copy of it.
+        """
+        instance = _DEFAULT_INSTANCES.get(cls)
+        if instance is None:
+            instance = _DEFAULT_INSTANCES[cls] = cls(**cls.field_defaults())
+
+        if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+            return instance
+
+        return copy.copy(instance)
+
+    @classmethod
+    def from_partial(cls, data: dict[str, Any]):
+        """Build from a possibly incomplete dict, ignoring unknown keys."""
         fields: dict[str, Any] = {
-            f.name: (f.default if f.default != MISSING else None)
-            for f in dataclasses.fields(cls)
+            name: data.get(name, default)
+            for name, default in cls.field_defaults().items()
         }
 
         return cls(**fields)
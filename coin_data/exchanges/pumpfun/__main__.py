@@ -1,32 +1,63 @@
 import argparse
 import concurrent.futures
-import csv
-import dataclasses
 import json
 import os
 import threading
 import time
+from functools import partial
 from pathlib import Path
+from typing import Iterable
 
 from dotenv import load_dotenv
 
 from coin_data.config import PUMPFUN_DATA_DIR
-from coin_data.exchanges.pumpfun.coin_meta import Token, extract_coin_meta
-from coin_data.exchanges.pumpfun.general import fetch_coin_data
-from coin_data.exchanges.pumpfun.holders import (
-    fetch_24_hour_volume,
-    fetch_total_holders,
+from coin_data.exchanges.pumpfun.activity_export import (
+    EXPORT_WINDOW_SECONDS,
+    WindowedActivityExport,
 )
+from coin_data.exchanges.pumpfun.cache import (
+    IdentityCache,
+    MarketCapStateCache,
+    TokenIdentity,
+)
+from coin_data.exchanges.pumpfun.cohorts import update_cohorts
+from coin_data.exchanges.pumpfun.compaction import compact
+from coin_data.exchanges.pumpfun.daemon import (
+    DAEMON_POLL_INTERVAL,
+    DAEMON_WINDOW_OVERLAP,
+    GraduationDaemon,
+)
+from coin_data.exchanges.pumpfun.enrichment import (
+    ENRICHMENT_POOL_FIELDS,
+    MARKET_CAP_FIELDS,
+    STATS_FIELDS,
+    EnrichmentContext,
+    enrich,
+)
+from coin_data.exchanges.pumpfun.general import load_coin_meta
 from coin_data.exchanges.pumpfun.market_cap import (
-    get_market_cap_with_times,
-    get_token_data,
+    MarketCapAggregator,
+    ResponseData,
+    get_tokens_data,
 )
+from coin_data.exchanges.pumpfun.mint_index import MintIndex, results_date
 from coin_data.exchanges.pumpfun.ohlc import get_ohlc
+from coin_data.exchanges.pumpfun.refresh import REFRESH_MAX_WORKERS, refresh_results
 from coin_data.exchanges.pumpfun.reports import ProcessCsvResponse, process_single_csv
+from coin_data.exchanges.pumpfun.schema import Token
+from coin_data.exchanges.pumpfun.sinks import (
+    RESULTS_FORMATS,
+    ResultsFormat,
+    existing_results_path,
+    open_results_sink,
+    results_files,
+)
+from coin_data.exchanges.pumpfun.summary import update_summary
 from coin_data.exchanges.pumpfun.token_explorer import (
     PumpfunTokenDataExplorer,
     Transaction,
 )
+from coin_data.exchanges.pumpfun.universe import publish_universe
 from coin_data.logging import logger
 from coin_data.utils.email import send_email
 
@@ -37,61 +68,66 @@ MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1  # in seconds
 
 
-def process_token(token: Transaction) -> Token | None:
+def process_token(
+    token: Transaction,
+    coin_meta: Token | None = None,
+    pool_response: ResponseData | None = None,
+    identity_cache: IdentityCache | None = None,
+    state_cache: MarketCapStateCache | None = None,
+) -> Token | None:
     """
     Process a single token to fetch data and compute market cap.
     Returns a Token dataclass instance or None if processing fails.
+
+    `coin_meta` and `pool_response` may be prefetched by the caller (see
+    `update_results_csv`) to skip the per-token pump.fun and pool requests.
+    With an `identity_cache`, a known mint skips straight to the volatile
+    endpoints and a new one is added once processed. With a `state_cache`,
+    the market cap aggregator is saved so a later refresh only folds new
+    candles.
     """
     try:
         logger.info(f"🚀 Processing token {token.token_address}")
 
-        coin_data = fetch_coin_data(token.token_address)
-        coin_meta = extract_coin_meta(coin_data)
-        if not coin_meta.name:
-            logger.error(f"❌ Failed to extract coin meta for: {token.token_address}")
-            return None
+        identity = identity_cache.get(token.token_address) if identity_cache else None
+        if identity is not None:
+            coin_meta = identity.to_token()
+        elif coin_meta is None:
+            coin_meta = load_coin_meta(token.token_address)
+            if coin_meta is None:
+                return None
 
-        volume = fetch_24_hour_volume(coin_meta.raydium_pool)
-        holder_count = fetch_total_holders(token.token_address)
-        token_response_data = get_token_data(coin_meta.raydium_pool)
-        token_data = token_response_data.data
-        if not token_data:
-            logger.error(f"❌ Failed to fetch token data for: {token.token_address}")
-            return None
+        context = EnrichmentContext(
+            mint=token.token_address,
+            raydium_pool=coin_meta.raydium_pool,
+            pool_response=pool_response,
+        )
+        fields = enrich(
+            context, known=identity.enrichment_fields() if identity else None
+        )
 
-        relationships = token_data.relationships
-        if not relationships:
-            logger.error(f"❌ Missing token pair data for: {token.token_address}")
+        missing_fields = MARKET_CAP_FIELDS - fields.keys()
+        if missing_fields:
+            logger.error(
+                f"❌ Missing {', '.join(sorted(missing_fields))} for: {token.token_address}"
+            )
             return None
 
-        included_data = token_response_data.included
-        if not included_data:
-            logger.error(f"❌ Missing included data for: {token.token_address}")
-            return None
+        for field in STATS_FIELDS - fields.keys():
+            logger.warning(f"⚠️ Missing {field} for: {token.token_address}")
 
-        circulating_supply = next(
-            (
-                d.attributes["circulating_supply"]
-                for d in included_data
-                if d.id == token_data.attributes.base_token_id
-            ),
-            None,
+        ohlc_data = get_ohlc(fields["pool_id"], fields["pair_id"])
+        aggregator = MarketCapAggregator.from_ohlc(
+            ohlc_data, fields["circulating_supply"], token.token_address
         )
-
-        if circulating_supply is None:
-            logger.error(f"❌ Missing circulating supply for: {token.token_address}")
-            return None
-
-        token_pair_id = relationships.pairs["data"][0]["id"]
-        ohlc_data = get_ohlc(token_data.id, token_pair_id)
-        market_cap = get_market_cap_with_times(ohlc_data, circulating_supply)
+        market_cap = aggregator.snapshot()
 
         token_ = Token(
             name=coin_meta.name,
             symbol=coin_meta.symbol,
             mint=token.token_address,
-            volume=volume,
-            holder_count=holder_count,
+            volume=fields.get("volume", 0),
+            holder_count=fields.get("holder_count", 0),
             image_uri=coin_meta.image_uri,
             telegram=coin_meta.telegram,
             twitter=coin_meta.twitter,
@@ -106,6 +142,12 @@ def process_token(token: Transaction) -> Token | None:
             current_market_cap_timestamp=market_cap.get("current_market_cap_time", 0),
         )
 
+        if identity_cache is not None and identity is None:
+            identity_cache.put(TokenIdentity.from_token(token_, fields))
+
+        if state_cache is not None and aggregator.candle_count:
+            state_cache.put(aggregator)
+
         logger.info(f"✅ Processed token {coin_meta.name} ({token.token_address})")
 
         return token_
@@ -115,47 +157,133 @@ def process_token(token: Transaction) -> Token | None:
         return None
 
 
-def update_results_csv(json_data: list[Transaction], results_file: Path):
-    """Process tokens and append missing ones to the results CSV."""
-    csv_lock = threading.Lock()
-    token_fieldnames = [field.name for field in dataclasses.fields(Token)]
-    existing_tokens: set[str] = set()
-
-    if os.path.exists(results_file):
-        with open(results_file, "r", newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            existing_tokens = {row["mint"] for row in reader}
-
-    json_data = [
-        token for token in json_data if token.token_address not in existing_tokens
-    ]
-
-    with open(results_file, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=token_fieldnames)
-
-        if not existing_tokens:
-            writer.writeheader()
-
-        def write_result_callback(future: concurrent.futures.Future[Token | None]):
-            result = future.result()
-            if result:
-                with csv_lock:
-                    writer.writerow(dataclasses.asdict(result))
-                    csvfile.flush()
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [executor.submit(process_token, token) for token in json_data]
-            for future in futures:
-                future.add_done_callback(write_result_callback)
-            concurrent.futures.wait(futures)
-
-    logger.info(f"📝 Results written to {results_file}")
+def update_results_csv(
+    batches: Iterable[list[Transaction]],
+    results_file: Path,
+    results_format: ResultsFormat = "csv",
+    csv_export: bool = False,
+    bloom: bool = False,
+):
+    """
+    Process batches of tokens and append missing ones to the day's results,
+    written through the `results_format` sink. The index, caches and sink
+    are opened once for all batches, and the summary and cohorts are updated
+    once at the end.
+
+    Mints already processed on any day are skipped via the global
+    `MintIndex`, which is updated under the same lock as each committed row.
+    `bloom` puts a Bloom filter in front of it, for scrapes and backfills.
+    """
+    sink_lock = threading.Lock()
+    date = results_date(results_file)
+
+    with MintIndex(bloom=bloom) as mint_index:
+        mint_index.index_results_file(results_file)
+
+        with open_results_sink(results_file, results_format, csv_export) as sink:
+
+            def record_committed(committed: list[Token]) -> None:
+                for token in committed:
+                    mint_index.record_token(token, date)
+
+            def write_result_callback(
+                mint: str, future: concurrent.futures.Future[Token | None]
+            ):
+                result = future.result()
+                with sink_lock:
+                    if result:
+                        record_committed(sink.write(result))
+                    else:
+                        mint_index.record(mint, date, "failed")
+
+            with (
+                IdentityCache() as identity_cache,
+                MarketCapStateCache() as state_cache,
+                concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor,
+            ):
+                for json_data in batches:
+                    processed = mint_index.processed(
+                        token.token_address for token in json_data
+                    )
+                    json_data = [
+                        token
+                        for token in json_data
+                        if token.token_address not in processed
+                    ]
+
+                    mints = list(
+                        dict.fromkeys(token.token_address for token in json_data)
+                    )
+                    identities = identity_cache.get_many(mints)
+                    coin_metas: dict[str, Token | None] = {
+                        mint: identity.to_token()
+                        for mint, identity in identities.items()
+                    }
+                    missing = [mint for mint in mints if mint not in identities]
+                    coin_metas.update(
+                        zip(missing, executor.map(load_coin_meta, missing))
+                    )
+
+                    for mint in missing:
+                        if coin_metas[mint] is None:
+                            mint_index.record(mint, date, "failed")
+
+                    # One multi-pool lookup per chunk instead of one request per token
+                    pool_responses = get_tokens_data(
+                        [meta.raydium_pool for meta in coin_metas.values() if meta],
+                        ENRICHMENT_POOL_FIELDS,
+                    )
+
+                    futures = {
+                        executor.submit(
+                            process_token,
+                            token,
+                            coin_meta,
+                            pool_responses.get(coin_meta.raydium_pool),
+                            identity_cache,
+                            state_cache,
+                        ): token.token_address
+                        for token in json_data
+                        if (coin_meta := coin_metas[token.token_address])
+                    }
+                    for future, mint in futures.items():
+                        future.add_done_callback(partial(write_result_callback, mint))
+                    concurrent.futures.wait(futures)
+
+            with sink_lock:
+                record_committed(sink.flush())
+
+    logger.info(f"📝 Results written to {sink.path}")
+    update_summary()
+    update_cohorts()
+
+
+def update_and_publish(
+    json_data: list[Transaction],
+    results_file: Path,
+    results_format: ResultsFormat = "csv",
+    csv_export: bool = False,
+):
+    """`update_results_csv` for one batch, then republish the token universe."""
+    update_results_csv([json_data], results_file, results_format, csv_export)
+    publish_universe()
 
 
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Retrieve and process Pumpfun token activity."
     )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["scrape", "refresh", "daemon", "compact"],
+        default="scrape",
+        help=(
+            "scrape a day's graduations (default), refresh existing results, "
+            "watch for new graduations continuously, or compact daily files "
+            "into monthly partitions"
+        ),
+    )
     parser.add_argument(
         "--date",
         type=str,
@@ -166,6 +294,47 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Send email with the AI report",
     )
+    parser.add_argument(
+        "--files",
+        nargs="*",
+        type=Path,
+        help="Result files to refresh (default: --date, or every results file)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=int,
+        default=DAEMON_POLL_INTERVAL,
+        help="Seconds between activity polls in daemon mode",
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        default=DAEMON_WINDOW_OVERLAP,
+        help="Seconds each daemon poll re-reads from the previous window",
+    )
+    parser.add_argument(
+        "--export-window",
+        type=int,
+        default=EXPORT_WINDOW_SECONDS,
+        help="Seconds of activity per concurrent solscan export request",
+    )
+    parser.add_argument(
+        "--results-format",
+        choices=RESULTS_FORMATS,
+        default="csv",
+        help="Format of the results files written by scrape and daemon modes",
+    )
+    parser.add_argument(
+        "--csv-export",
+        action="store_true",
+        help="Also keep a CSV copy of Parquet results",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=REFRESH_MAX_WORKERS,
+        help="Concurrent tokens when refreshing",
+    )
 
     return parser.parse_args()
 
@@ -176,11 +345,6 @@ def get_date_range(explorer: PumpfunTokenDataExplorer, date_arg: str | None):
     return explorer.calculate_yesterday_timestamps()
 
 
-def write_file(file_path: Path, data: str) -> None:
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(data)
-
-
 def get_valid_report_path(result: ProcessCsvResponse, results_file: Path) -> str | None:
     if (
         result.status != "success"
@@ -233,14 +397,60 @@ def load_report_body(report_path: str) -> str:
     return report_json.get("summary", "")
 
 
+def refresh(args: argparse.Namespace) -> None:
+    # One file per day; a Parquet file also rewrites its CSV export
+    if args.files:
+        paths = [path for path in args.files if path.exists()]
+    elif args.date:
+        path = existing_results_path(PUMPFUN_DATA_DIR / f"results_{args.date}.csv")
+        paths = [path] if path else []
+    else:
+        paths = results_files(PUMPFUN_DATA_DIR)
+
+    logger.info(f"🔄 Refreshing {len(paths)} results files")
+
+    updated_rows = refresh_results(paths, args.workers)
+    logger.info(f"✅ Refresh complete: {updated_rows} rows updated")
+    update_summary()
+    update_cohorts()
+    publish_universe()
+
+
 def main():
     args = parse_arguments()
+
+    if args.mode == "refresh":
+        refresh(args)
+        return
+
+    if args.mode == "compact":
+        written = compact()
+        update_summary()
+        update_cohorts()
+        logger.info(f"✅ Compaction complete: {written} partitions written")
+        return
+
+    if args.mode == "daemon":
+        PUMPFUN_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        GraduationDaemon(
+            PumpfunTokenDataExplorer(),
+            PUMPFUN_DATA_DIR,
+            partial(
+                update_and_publish,
+                results_format=args.results_format,
+                csv_export=args.csv_export,
+            ),
+            poll_interval=args.poll_interval,
+            overlap=args.overlap,
+            export_window=args.export_window,
+        ).run()
+        return
+
     explorer = PumpfunTokenDataExplorer()
 
     start_ts, end_ts = get_date_range(explorer, args.date)
     logger.info(f"🚀 Retrieving token activity from {start_ts} to {end_ts}")
 
-    csv_data = explorer.retrieve_token_activity(start_ts, end_ts)
     output_dir = PUMPFUN_DATA_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -252,15 +462,29 @@ def main():
     activities_file = output_dir / f"activities_{date_suffix}.csv"
     results_file = output_dir / f"results_{date_suffix}.csv"
 
-    write_file(activities_file, csv_data)
-    json_data = explorer.convert_csv_to_dict(csv_data)
-    update_results_csv(json_data, results_file)
+    csv_data = WindowedActivityExport(
+        explorer, window_seconds=args.export_window
+    ).retrieve(start_ts, end_ts, activities_file)
+    transactions = explorer.unique_mints(explorer.convert_csv_to_frame(csv_data))
+    logger.info(f"🪙 {transactions.height} graduated tokens to process")
+    if not transactions.height:
+        return
+
+    update_results_csv(
+        explorer.iter_transaction_batches(transactions),
+        results_file,
+        args.results_format,
+        args.csv_export,
+        bloom=True,
+    )
+    results_file = existing_results_path(results_file) or results_file
+    publish_universe()
 
     logger.info("🚀 Generating AI reports")
     report_file = (
         os.path.basename(results_file)
         .replace("results_", "report_")
-        .replace(".csv", ".json")
+        .replace(results_file.suffix, ".json")
     )
 
     result = process_single_csv(str(results_file), report_file)
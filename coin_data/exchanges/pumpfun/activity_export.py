@@ -0,0 +1,182 @@
+import concurrent.futures
+import json
+import os
+import time
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.exchanges.pumpfun.token_explorer import (
+    TRANSACTION_COLUMNS,
+    PumpfunTokenDataExplorer,
+)
+from coin_data.logging import logger
+
+EXPORT_WINDOW_SECONDS = 3600
+EXPORT_MIN_WINDOW_SECONDS = 60
+EXPORT_MAX_WORKERS = 4
+# A window returning this many rows may have been truncated by solscan
+EXPORT_ROW_LIMIT = 1000
+# Windows ending this close to the fetch time may still be indexing
+EXPORT_SETTLE_SECONDS = 120
+# Header of an export without rows, so an empty day still parses
+EXPORT_SCHEMA = dict.fromkeys(TRANSACTION_COLUMNS, pl.Utf8)
+
+Window = tuple[int, int]
+
+
+def split_windows(start_ts: int, end_ts: int, window_seconds: int) -> list[Window]:
+    """Split an inclusive time range into consecutive inclusive windows."""
+    window_seconds = max(1, window_seconds)
+    return [
+        (window_start, min(end_ts, window_start + window_seconds - 1))
+        for window_start in range(start_ts, end_ts + 1, window_seconds)
+    ]
+
+
+def coverage_path(activities_file: Path) -> Path:
+    """`activities_2025-01-31.csv` -> `activities_2025-01-31.json`"""
+    return activities_file.with_suffix(".json")
+
+
+def load_coverage(activities_file: Path) -> list[Window]:
+    path = coverage_path(activities_file)
+    if not activities_file.exists() or not path.exists():
+        return []
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [tuple(window) for window in json.load(f)["windows"]]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"⚠️ Ignoring unreadable export coverage {path}: {e}")
+        return []
+
+
+def is_covered(window: Window, coverage: list[Window]) -> bool:
+    return any(start <= window[0] and window[1] <= end for start, end in coverage)
+
+
+def merge_coverage(windows: list[Window]) -> list[Window]:
+    merged: list[Window] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def read_export(csv_data: str) -> pl.DataFrame:
+    if not csv_data.strip():
+        return pl.DataFrame(schema=EXPORT_SCHEMA)
+    return pl.read_csv(csv_data.encode(), infer_schema=False)
+
+
+def merge_exports(frames: list[pl.DataFrame]) -> pl.DataFrame:
+    """
+    Concatenate window exports, keeping each signature's rows from the first
+    frame it appears in. A transaction on a window boundary can be returned
+    by both neighbours, while one transaction may hold several transfers.
+    Without any rows the result is still a frame with the export's header.
+    """
+    frames = [
+        frame.with_columns(pl.lit(index).alias("__window"))
+        for index, frame in enumerate(frames)
+        if frame.height
+    ]
+    if not frames:
+        return pl.DataFrame(schema=EXPORT_SCHEMA)
+
+    combined = pl.concat(frames, how="diagonal")
+    return combined.filter(
+        pl.col("__window") == pl.col("__window").min().over("Signature")
+    ).drop("__window")
+
+
+class WindowedActivityExport:
+    """
+    Fetch a day of migration transfers as concurrent sub-window exports and
+    merge them by signature. Windows that hit `EXPORT_ROW_LIMIT` are split
+    in half until complete. With an `activities_file`, windows recorded in
+    its coverage sidecar are reused instead of fetched again.
+    """
+
+    def __init__(
+        self,
+        explorer: PumpfunTokenDataExplorer,
+        window_seconds: int = EXPORT_WINDOW_SECONDS,
+        max_workers: int = EXPORT_MAX_WORKERS,
+        row_limit: int = EXPORT_ROW_LIMIT,
+    ) -> None:
+        self.explorer = explorer
+        self.window_seconds = window_seconds
+        self.max_workers = max_workers
+        self.row_limit = row_limit
+
+    def fetch_window(self, window: Window) -> list[tuple[Window, pl.DataFrame]]:
+        start_ts, end_ts = window
+        frame = read_export(self.explorer.retrieve_token_activity(start_ts, end_ts))
+
+        if frame.height < self.row_limit:
+            return [(window, frame)]
+
+        if end_ts - start_ts + 1 <= EXPORT_MIN_WINDOW_SECONDS:
+            logger.warning(
+                f"⚠️ Export window {start_ts}-{end_ts} returned {frame.height} rows "
+                "and may be truncated"
+            )
+            return [(window, frame)]
+
+        middle = (start_ts + end_ts) // 2
+        return self.fetch_window((start_ts, middle)) + self.fetch_window(
+            (middle + 1, end_ts)
+        )
+
+    def retrieve(
+        self, start_ts: int, end_ts: int, activities_file: Path | None = None
+    ) -> str:
+        """Return the merged export CSV, updating `activities_file` if given."""
+        fetched_at = int(time.time())
+        coverage = load_coverage(activities_file) if activities_file else []
+        windows = split_windows(start_ts, end_ts, self.window_seconds)
+        missing = [window for window in windows if not is_covered(window, coverage)]
+
+        logger.info(
+            f"📦 Exporting {len(missing)}/{len(windows)} activity windows "
+            f"({len(windows) - len(missing)} reused)"
+        )
+
+        frames: list[pl.DataFrame] = []
+        if activities_file and coverage:
+            frames.append(read_export(activities_file.read_text(encoding="utf-8")))
+
+        fetched: list[Window] = []
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            for results in executor.map(self.fetch_window, missing):
+                for window, frame in results:
+                    frames.append(frame)
+                    if window[1] < fetched_at - EXPORT_SETTLE_SECONDS:
+                        fetched.append(window)
+
+        merged = merge_exports(frames)
+        csv_data = merged.write_csv()
+
+        if activities_file:
+            self.save(activities_file, csv_data, merge_coverage(coverage + fetched))
+
+        return csv_data
+
+    @staticmethod
+    def save(activities_file: Path, csv_data: str, coverage: list[Window]) -> None:
+        tmp_file = activities_file.with_suffix(activities_file.suffix + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(csv_data)
+        os.replace(tmp_file, activities_file)
+
+        # Written after the CSV, so a crash in between only loses coverage
+        sidecar = coverage_path(activities_file)
+        tmp_sidecar = sidecar.with_suffix(".json.tmp")
+        with open(tmp_sidecar, "w", encoding="utf-8") as f:
+            json.dump({"windows": coverage}, f)
+        os.replace(tmp_sidecar, sidecar)
@@ -0,0 +1,241 @@
+import dataclasses
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Optional, Self, Type
+
+from coin_data.config import (
+    PUMPFUN_IDENTITY_CACHE_PATH,
+    PUMPFUN_MARKET_CAP_STATE_PATH,
+)
+from coin_data.exchanges.pumpfun.market_cap import MarketCapAggregator
+from coin_data.exchanges.pumpfun.schema import Token
+from coin_data.utils.mint_key import decode_mint, encode_mint
+
+# Bump when the stored layout changes; stale rows are dropped on open
+IDENTITY_CACHE_VERSION = 3
+MARKET_CAP_STATE_CACHE_VERSION = 2
+SQLITE_MAX_VARIABLES = 900
+
+
+@dataclass(slots=True, frozen=True)
+class TokenIdentity:
+    """Fields of a graduated token that never change after migration."""
+
+    mint: str
+    name: str
+    symbol: str
+    image_uri: str
+    telegram: str
+    twitter: str
+    website: str
+    created_timestamp: Any
+    raydium_pool: str
+    pool_id: str
+    base_token_id: str
+    pair_id: str
+    # pump.fun mints a fixed supply, so the last seen value is reused as-is
+    circulating_supply: float
+
+    @classmethod
+    def from_token(cls, token: Token, fields: dict[str, Any]) -> "TokenIdentity":
+        return cls(
+            mint=token.mint,
+            name=token.name,
+            symbol=token.symbol,
+            image_uri=token.image_uri,
+            telegram=token.telegram,
+            twitter=token.twitter,
+            website=token.website,
+            created_timestamp=token.created_timestamp,
+            raydium_pool=token.raydium_pool,
+            pool_id=fields["pool_id"],
+            base_token_id=fields.get("base_token_id", ""),
+            pair_id=fields["pair_id"],
+            circulating_supply=fields["circulating_supply"],
+        )
+
+    def to_token(self) -> Token:
+        """A coin meta `Token` as `extract_coin_meta` would have returned it."""
+        return Token(
+            name=self.name,
+            symbol=self.symbol,
+            mint=self.mint,
+            volume=0,
+            holder_count=0,
+            image_uri=self.image_uri,
+            telegram=self.telegram,
+            twitter=self.twitter,
+            website=self.website,
+            created_timestamp=self.created_timestamp,
+            raydium_pool=self.raydium_pool,
+            highest_market_cap=0,
+            highest_market_cap_timestamp=0,
+            lowest_market_cap=0,
+            lowest_market_cap_timestamp=0,
+            current_market_cap=0,
+            current_market_cap_timestamp=0,
+        )
+
+    def enrichment_fields(self) -> dict[str, Any]:
+        """Known enrichment fields, so only volatile ones are fetched."""
+        return {
+            "pool_id": self.pool_id,
+            "base_token_id": self.base_token_id,
+            "pair_id": self.pair_id,
+            "circulating_supply": self.circulating_supply,
+        }
+
+    def encode(self) -> str:
+        # Positional JSON array: no repeated keys on disk
+        return json.dumps(dataclasses.astuple(self)[1:], separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, mint: str, value: str) -> "TokenIdentity":
+        return cls(mint, *json.loads(value))
+
+
+class SqliteStore:
+    """
+    Persistent string-keyed store backed by a single SQLite table.
+
+    Entries are never expired. Safe to share between the worker threads of
+    `update_results_csv`. Subclasses set `table` (and `columns` when they
+    store more than one value) and bump `version` when their layout changes;
+    stale rows are dropped on open. `MintKeyedStore` keeps mints as 32-byte
+    keys rather than base58 text.
+    """
+
+    table = "store"
+    key_type = "TEXT"
+    columns = "value TEXT NOT NULL"
+    version = 1
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.version:
+            self.conn.execute(f"DROP TABLE IF EXISTS {self.table}")
+            self.conn.execute(f"PRAGMA user_version = {self.version}")
+
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} "
+            f"(key {self.key_type} PRIMARY KEY, {self.columns}) WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get_raw(key) is not None
+
+    @staticmethod
+    def encode_key(key: str) -> Any:
+        return key
+
+    @staticmethod
+    def decode_key(key: Any) -> str:
+        return key
+
+    def get_raw(self, key: str) -> str | None:
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?",
+                (self.encode_key(key),),
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def get_many_raw(self, keys: Iterable[str]) -> dict[str, str]:
+        unique_keys = list(dict.fromkeys(keys))
+        values: dict[str, str] = {}
+
+        for start in range(0, len(unique_keys), SQLITE_MAX_VARIABLES):
+            chunk = unique_keys[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT key, value FROM {self.table} "
+                    f"WHERE key IN ({placeholders})",
+                    [self.encode_key(key) for key in chunk],
+                ).fetchall()
+
+            values.update((self.decode_key(key), value) for key, value in rows)
+
+        return values
+
+    def put_raw(self, key: str, value: str) -> None:
+        with self.lock:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                (self.encode_key(key), value),
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class MintKeyedStore(SqliteStore):
+    """`SqliteStore` keyed by mint, stored as 32-byte BLOBs."""
+
+    key_type = "BLOB"
+    encode_key = staticmethod(decode_mint)
+    decode_key = staticmethod(encode_mint)
+
+
+class IdentityCache(MintKeyedStore):
+    """Mint -> `TokenIdentity`, so refresh runs skip straight to volatile data."""
+
+    table = "identity"
+    version = IDENTITY_CACHE_VERSION
+
+    def __init__(self, path: Path = PUMPFUN_IDENTITY_CACHE_PATH) -> None:
+        super().__init__(path)
+
+    def get(self, mint: str) -> TokenIdentity | None:
+        value = self.get_raw(mint)
+        return TokenIdentity.decode(mint, value) if value else None
+
+    def get_many(self, mints: Iterable[str]) -> dict[str, TokenIdentity]:
+        return {
+            mint: TokenIdentity.decode(mint, value)
+            for mint, value in self.get_many_raw(mints).items()
+        }
+
+    def put(self, identity: TokenIdentity) -> None:
+        self.put_raw(identity.mint, identity.encode())
+
+
+class MarketCapStateCache(MintKeyedStore):
+    """Mint -> `MarketCapAggregator` state, so refreshes only fold new candles."""
+
+    table = "market_cap_state"
+    version = MARKET_CAP_STATE_CACHE_VERSION
+
+    def __init__(self, path: Path = PUMPFUN_MARKET_CAP_STATE_PATH) -> None:
+        super().__init__(path)
+
+    def get(self, mint: str) -> MarketCapAggregator | None:
+        value = self.get_raw(mint)
+        return MarketCapAggregator.from_json(value) if value else None
+
+    def put(self, state: MarketCapAggregator) -> None:
+        self.put_raw(state.mint, state.to_json())
@@ -0,0 +1,275 @@
+import dataclasses
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.config import PUMPFUN_COHORTS_PATH, PUMPFUN_DATA_DIR
+from coin_data.exchanges.pumpfun.sinks import (
+    results_files,
+    scan_results_file,
+    source_signature,
+)
+from coin_data.logging import logger
+
+COHORTS_VERSION = 2
+# Market caps a cohort's share of tokens is measured against
+COHORT_MARKET_CAP_THRESHOLDS = (100_000, 1_000_000, 10_000_000)
+# Token ages, in hours, at which the survival curves are sampled
+COHORT_SURVIVAL_HOURS = (1, 6, 24, 72, 168)
+
+# `str(timedelta)` with a leading "+": "+2:05:09", "+3 days, 2:05:09"
+RELATIVE_TIME_PATTERN = (
+    r"^\+?(?:(?P<days>-?\d+) days?, )?"
+    r"(?P<hours>\d+):(?P<minutes>\d{2}):(?P<seconds>\d{2})"
+)
+
+
+def relative_seconds(column: str) -> pl.Expr:
+    """Parse a relative market-cap timestamp into seconds since creation."""
+    parts = pl.col(column).str.extract_groups(RELATIVE_TIME_PATTERN)
+    return (
+        parts.struct.field("days").cast(pl.Int64).fill_null(0) * 86400
+        + parts.struct.field("hours").cast(pl.Int64) * 3600
+        + parts.struct.field("minutes").cast(pl.Int64) * 60
+        + parts.struct.field("seconds").cast(pl.Int64)
+    )
+
+
+@dataclass(slots=True)
+class Cohort:
+    """Analytics for the tokens that graduated on one day."""
+
+    date: str
+    file: str
+    tokens: int
+    # [size, mtime_ns] of the results file when it was analyzed
+    source: list[int] = field(default_factory=list)
+    median_seconds_to_peak: float | None = None
+    # Threshold -> share of tokens with a known current market cap at least that
+    share_above: dict[str, float | None] = field(default_factory=dict)
+    # Hours -> share of the tokens observed for at least that long that had
+    # not yet peaked at that age; None when no token was observed that long
+    survival: dict[str, float | None] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CohortManifest:
+    cohorts: dict[str, Cohort] = field(default_factory=dict)
+    thresholds: list[int] = field(
+        default_factory=lambda: list(COHORT_MARKET_CAP_THRESHOLDS)
+    )
+    survival_hours: list[int] = field(
+        default_factory=lambda: list(COHORT_SURVIVAL_HOURS)
+    )
+    version: int = COHORTS_VERSION
+
+    @classmethod
+    def load(cls, path: Path = PUMPFUN_COHORTS_PATH) -> "CohortManifest":
+        """The saved cohorts, or none if they were computed with other settings."""
+        if not path.exists():
+            return cls()
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+
+        manifest = cls()
+        if (
+            data.get("version") != manifest.version
+            or data.get("thresholds") != manifest.thresholds
+            or data.get("survival_hours") != manifest.survival_hours
+        ):
+            return manifest
+
+        manifest.cohorts = {
+            date: Cohort(**value) for date, value in data["cohorts"].items()
+        }
+        return manifest
+
+    def save(self, path: Path = PUMPFUN_COHORTS_PATH) -> None:
+        tmp_file = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(self), f)
+        os.replace(tmp_file, path)
+
+    def frame(self) -> pl.DataFrame:
+        """
+        One row per cohort: date, tokens, median_hours_to_peak and a
+        `share_above_<threshold>` column per threshold.
+        """
+        return (
+            pl.DataFrame(
+                [
+                    {
+                        "date": cohort.date,
+                        "tokens": cohort.tokens,
+                        "median_hours_to_peak": (
+                            cohort.median_seconds_to_peak / 3600
+                            if cohort.median_seconds_to_peak is not None
+                            else None
+                        ),
+                        **{
+                            f"share_above_{threshold}": cohort.share_above.get(
+                                str(threshold)
+                            )
+                            for threshold in self.thresholds
+                        },
+                    }
+                    for cohort in self.cohorts.values()
+                ],
+                schema={
+                    "date": pl.Utf8,
+                    "tokens": pl.Int64,
+                    "median_hours_to_peak": pl.Float64,
+                    **{
+                        f"share_above_{threshold}": pl.Float64
+                        for threshold in self.thresholds
+                    },
+                },
+            )
+            .with_columns(pl.col("date").str.to_date())
+            .sort("date")
+        )
+
+    def survival_frame(self) -> pl.DataFrame:
+        """Survival curves in long form: date, hours, survival."""
+        return (
+            pl.DataFrame(
+                [
+                    {
+                        "date": cohort.date,
+                        "hours": hours,
+                        "survival": cohort.survival.get(str(hours)),
+                    }
+                    for cohort in self.cohorts.values()
+                    for hours in self.survival_hours
+                ],
+                schema={"date": pl.Utf8, "hours": pl.Int64, "survival": pl.Float64},
+            )
+            .with_columns(pl.col("date").str.to_date())
+            .sort("date", "hours")
+        )
+
+
+def cohort_aggregates() -> list[pl.Expr]:
+    seconds_to_peak = pl.col("seconds_to_peak")
+    # Tokens younger than an age cannot tell whether they peak before it
+    observed_seconds = pl.col("observed_seconds")
+    return [
+        pl.len().alias("tokens"),
+        seconds_to_peak.median().alias("median_seconds_to_peak"),
+        *(
+            (pl.col("current_market_cap") >= threshold)
+            .mean()
+            .alias(f"share_above_{threshold}")
+            for threshold in COHORT_MARKET_CAP_THRESHOLDS
+        ),
+        *(
+            (seconds_to_peak > hours * 3600)
+            .filter(observed_seconds >= hours * 3600)
+            .mean()
+            .alias(f"survival_{hours}")
+            for hours in COHORT_SURVIVAL_HOURS
+        ),
+    ]
+
+
+def analyze_cohorts(paths: list[Path]) -> list[Cohort]:
+    """Compute the cohorts of several results files in one lazy group-by."""
+    if not paths:
+        return []
+
+    frame = pl.concat(
+        [
+            scan_results_file(path).select(
+                pl.lit(path.stem.removeprefix("results_")).alias("date"),
+                pl.col("current_market_cap"),
+                relative_seconds("highest_market_cap_timestamp").alias(
+                    "seconds_to_peak"
+                ),
+                relative_seconds("current_market_cap_timestamp").alias(
+                    "observed_seconds"
+                ),
+            )
+            for path in paths
+        ]
+    )
+    rows = frame.group_by("date").agg(cohort_aggregates()).collect()
+
+    signature = source_signature(paths)
+    files = {path.stem.removeprefix("results_"): path.name for path in paths}
+
+    # Days without rows have no group; record them as empty cohorts
+    empty = [
+        Cohort(date=date, file=file, tokens=0, source=signature.get(file, []))
+        for date, file in files.items()
+        if date not in rows["date"]
+    ]
+
+    return empty + [
+        Cohort(
+            date=row["date"],
+            file=files[row["date"]],
+            tokens=row["tokens"],
+            source=signature.get(files[row["date"]], []),
+            median_seconds_to_peak=row["median_seconds_to_peak"],
+            share_above={
+                str(threshold): row[f"share_above_{threshold}"]
+                for threshold in COHORT_MARKET_CAP_THRESHOLDS
+            },
+            survival={
+                str(hours): row[f"survival_{hours}"] for hours in COHORT_SURVIVAL_HOURS
+            },
+        )
+        for row in rows.iter_rows(named=True)
+    ]
+
+
+def update_cohorts(
+    data_dir: Path = PUMPFUN_DATA_DIR, path: Path = PUMPFUN_COHORTS_PATH
+) -> int:
+    """
+    Bring the cohort analytics in line with the results files in `data_dir`,
+    recomputing only the days whose file changed. Returns the number of
+    cohorts recomputed.
+    """
+    manifest = CohortManifest.load(path)
+    paths = {
+        results_file.stem.removeprefix("results_"): results_file
+        for results_file in results_files(data_dir)
+    }
+    signature = source_signature(paths.values())
+
+    changed = [
+        results_file
+        for date, results_file in paths.items()
+        if (cohort := manifest.cohorts.get(date)) is None
+        or cohort.file != results_file.name
+        or cohort.source != signature.get(results_file.name)
+    ]
+
+    try:
+        cohorts = analyze_cohorts(changed)
+    except pl.exceptions.PolarsError as e:
+        logger.warning(f"⚠️ Could not update cohorts: {e}")
+        return 0
+
+    manifest.cohorts.update((cohort.date, cohort) for cohort in cohorts)
+    removed = [date for date in manifest.cohorts if date not in paths]
+    for date in removed:
+        del manifest.cohorts[date]
+
+    if cohorts or removed or not path.exists():
+        manifest.save(path)
+        logger.info(f"📈 Updated {len(cohorts)} cohorts")
+
+    return len(cohorts)
+
+
+def load_cohorts(path: Path = PUMPFUN_COHORTS_PATH) -> CohortManifest:
+    return CohortManifest.load(path)
@@ -1,52 +1,61 @@
 import json
-import re
+from typing import Any, Iterable
 
+from coin_data.exchanges.pumpfun.constants import PUMPFUN_COIN_ROW_ID
 from coin_data.exchanges.pumpfun.schema import Token
 from coin_data.logging import logger
 from coin_data.utils.encoder import compress_data
 
+COIN_KEY = '"coin":'
+COIN_NOT_FOUND = b"coin doesn't exist or is still indexing"
+
+_json_decoder = json.JSONDecoder()
 
-def extract_coin_meta(raw_data: str) -> Token:
-    match = re.search(
-        r'2:\["\$","\$9",null,\{.*?"coin":(\{.*?\})[,}]', raw_data, re.DOTALL
-    )
 
-    if match:
-        coin_data = match.group(1)
+def find_coin_object(row: str) -> dict[str, Any] | None:
+    """
+    Decode the first `"coin": {...}` object in an RSC row with a real JSON
+    scanner, so nested objects and braces inside strings are handled.
+    """
+    start = row.find(COIN_KEY + "{")
 
+    while start != -1:
         try:
-            parsed_data = json.loads(coin_data)
-
-            return Token(
-                name=parsed_data.get("name"),
-                symbol=parsed_data.get("symbol"),
-                mint=parsed_data.get("mint"),
-                volume=0,
-                holder_count=0,
-                image_uri=parsed_data.get("image_uri"),
-                telegram=parsed_data.get("telegram"),
-                twitter=parsed_data.get("twitter"),
-                website=parsed_data.get("website"),
-                created_timestamp=parsed_data.get("created_timestamp"),
-                raydium_pool=parsed_data.get("raydium_pool"),
-                highest_market_cap=0,
-                highest_market_cap_timestamp=0,
-                lowest_market_cap=0,
-                lowest_market_cap_timestamp=0,
-                current_market_cap=0,
-                current_market_cap_timestamp=0,
-            )
+            coin, _ = _json_decoder.raw_decode(row, start + len(COIN_KEY))
         except json.JSONDecodeError:
-            logger.error(
-                f"Failed to parse coin data (compressed): {compress_data(coin_data)}"
-            )
-    else:
-        not_found = re.search(r"coin doesn't exist or is still indexing", raw_data)
-        if not_found:
-            logger.error("Coin not found")
-        else:
-            logger.error(f"Failed to parse coin data: {raw_data}")
+            coin = None
+
+        if isinstance(coin, dict):
+            return coin
+
+        start = row.find(COIN_KEY + "{", start + 1)
 
+    return None
+
+
+def token_from_coin(coin: dict[str, Any]) -> Token:
+    return Token(
+        name=coin.get("name"),
+        symbol=coin.get("symbol"),
+        mint=coin.get("mint"),
+        volume=0,
+        holder_count=0,
+        image_uri=coin.get("image_uri"),
+        telegram=coin.get("telegram"),
+        twitter=coin.get("twitter"),
+        website=coin.get("website"),
+        created_timestamp=coin.get("created_timestamp"),
+        raydium_pool=coin.get("raydium_pool"),
+        highest_market_cap=0,
+        highest_market_cap_timestamp=0,
+        lowest_market_cap=0,
+        lowest_market_cap_timestamp=0,
+        current_market_cap=0,
+        current_market_cap_timestamp=0,
+    )
+
+
+def empty_token() -> Token:
     return Token(
         name="",
         symbol="",
@@ -66,3 +75,37 @@ def extract_coin_meta(raw_data: str) -> Token:
         current_market_cap=0,
         current_market_cap_timestamp=0,
     )
+
+
+def extract_coin_meta_stream(
+    lines: Iterable[bytes], row_id: str = PUMPFUN_COIN_ROW_ID
+) -> Token:
+    """
+    Extract the coin metadata from a React Server Components payload, one
+    row per line. Returns as soon as the coin row is decoded, so a streamed
+    response is never read past it.
+    """
+    prefix = f"{row_id}:".encode()
+
+    for line in lines:
+        if line.startswith(prefix):
+            row = line[len(prefix) :].decode("utf-8", errors="replace")
+            coin = find_coin_object(row)
+            if coin is not None:
+                return token_from_coin(coin)
+
+            logger.error(
+                f"Failed to parse coin data (compressed): {compress_data(row)}"
+            )
+            return empty_token()
+
+        if COIN_NOT_FOUND in line:
+            logger.error("Coin not found")
+            return empty_token()
+
+    logger.error(f"Failed to parse coin data: row {row_id} not found")
+    return empty_token()
+
+
+def extract_coin_meta(raw_data: str) -> Token:
+    return extract_coin_meta_stream(raw_data.encode().splitlines())
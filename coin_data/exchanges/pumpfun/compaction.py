@@ -0,0 +1,379 @@
+import base64
+import dataclasses
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+import polars as pl
+
+from coin_data.config import (
+    PUMPFUN_ACTIVITIES_PATTERN,
+    PUMPFUN_COMPACTED_DIR,
+    PUMPFUN_COMPACTION_MANIFEST_PATH,
+    PUMPFUN_DATA_DIR,
+)
+from coin_data.exchanges.pumpfun.sinks import (
+    RESULTS_ROW_GROUP_SIZE,
+    read_results,
+    results_files,
+    scan_results_file,
+    source_signature,
+)
+from coin_data.exchanges.pumpfun.universe import UNIVERSE_SCHEMA
+from coin_data.logging import logger
+from coin_data.utils.bloom import BloomFilter
+from coin_data.utils.mint_key import decode_mints
+
+PartitionKind = Literal["results", "activities"]
+
+COMPACTION_MANIFEST_VERSION = 1
+COMPACTION_BLOOM_FALSE_POSITIVE_RATE = 0.01
+# Column holding the mint in each kind of partition
+PARTITION_MINT_COLUMNS: dict[PartitionKind, str] = {
+    "results": "mint",
+    "activities": "TokenAddress",
+}
+# Columns with min/max statistics in the manifest, besides date and mint
+RESULTS_STATS_COLUMNS = (
+    "volume",
+    "holder_count",
+    "created_timestamp",
+    "highest_market_cap",
+    "lowest_market_cap",
+    "current_market_cap",
+)
+
+
+@dataclass(slots=True)
+class Partition:
+    """Manifest entry for one monthly partition file."""
+
+    kind: PartitionKind
+    month: str
+    file: str
+    rows: int
+    # Source file name -> [size, mtime_ns] at compaction time
+    sources: dict[str, list[int]] = field(default_factory=dict)
+    # Column -> [min, max]
+    stats: dict[str, list[Any]] = field(default_factory=dict)
+    bloom: str = ""
+
+    def might_contain(self, mint_key: bytes) -> bool:
+        if not self.bloom:
+            return True
+        return mint_key in BloomFilter.from_bytes(base64.b64decode(self.bloom))
+
+    def overlaps(self, column: str, low: Any = None, high: Any = None) -> bool:
+        """Whether any row can fall within [low, high] on `column`."""
+        if column not in self.stats:
+            return True
+
+        column_min, column_max = self.stats[column]
+        if column_min is None:
+            return False
+        if low is not None and column_max < low:
+            return False
+        if high is not None and column_min > high:
+            return False
+        return True
+
+
+@dataclass(slots=True)
+class CompactionManifest:
+    partitions: dict[str, Partition] = field(default_factory=dict)
+    version: int = COMPACTION_MANIFEST_VERSION
+
+    @classmethod
+    def load(
+        cls, path: Path = PUMPFUN_COMPACTION_MANIFEST_PATH
+    ) -> "CompactionManifest":
+        if not path.exists():
+            return cls()
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != COMPACTION_MANIFEST_VERSION:
+            return cls()
+
+        return cls(
+            partitions={
+                key: Partition(**value) for key, value in data["partitions"].items()
+            }
+        )
+
+    def save(self, path: Path = PUMPFUN_COMPACTION_MANIFEST_PATH) -> None:
+        tmp_file = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(self), f)
+        os.replace(tmp_file, path)
+
+    def select(self, kind: PartitionKind) -> list[Partition]:
+        return sorted(
+            (
+                partition
+                for partition in self.partitions.values()
+                if partition.kind == kind
+            ),
+            key=lambda partition: partition.month,
+        )
+
+
+def file_date(path: Path) -> str:
+    """`results_2025-01-31.parquet` -> `2025-01-31`"""
+    return path.stem.split("_", 1)[1]
+
+
+def daily_files(data_dir: Path, kind: PartitionKind) -> dict[str, list[Path]]:
+    """Month -> that month's daily files, one per day."""
+    if kind == "activities":
+        paths = set(data_dir.glob(PUMPFUN_ACTIVITIES_PATTERN))
+    else:
+        paths = set(results_files(data_dir))
+
+    months: dict[str, list[Path]] = {}
+    for path in sorted(paths):
+        months.setdefault(file_date(path)[:7], []).append(path)
+
+    return months
+
+
+def read_daily_file(path: Path, kind: PartitionKind) -> pl.DataFrame:
+    if kind == "results":
+        frame = read_results(path)
+    else:
+        try:
+            frame = pl.read_csv(path, infer_schema=False)
+        except pl.exceptions.NoDataError:
+            return pl.DataFrame()
+
+    return frame.with_columns(pl.lit(file_date(path)).str.to_date().alias("date"))
+
+
+def scan_daily_file(path: Path, kind: PartitionKind) -> pl.LazyFrame:
+    """Lazy counterpart of `read_daily_file`."""
+    date = pl.lit(file_date(path)).str.to_date().alias("date")
+    if kind == "results":
+        return scan_results_file(path).with_columns(date).select(list(UNIVERSE_SCHEMA))
+    if path.stat().st_size == 0:
+        return pl.LazyFrame()
+    return pl.scan_csv(path, infer_schema=False).with_columns(date)
+
+
+def partition_is_current(
+    partition: Partition | None, paths: list[Path], output_dir: Path
+) -> bool:
+    """Whether the partition was built from exactly these daily files."""
+    return (
+        partition is not None
+        and partition.sources == source_signature(paths)
+        and (output_dir / partition.file).exists()
+    )
+
+
+def partition_stats(frame: pl.DataFrame, kind: PartitionKind) -> dict[str, list[Any]]:
+    mint_column = PARTITION_MINT_COLUMNS[kind]
+    columns = ["date", mint_column]
+    if kind == "results":
+        columns += [
+            column for column in RESULTS_STATS_COLUMNS if column in frame.columns
+        ]
+
+    bounds = frame.select(
+        *(pl.col(column).min().alias(f"{column}_min") for column in columns),
+        *(pl.col(column).max().alias(f"{column}_max") for column in columns),
+    ).row(0, named=True)
+
+    stats: dict[str, list[Any]] = {}
+    for column in columns:
+        low, high = bounds[f"{column}_min"], bounds[f"{column}_max"]
+        if column == "date" and low is not None:
+            low, high = low.isoformat(), high.isoformat()
+        stats["mint" if column == mint_column else column] = [low, high]
+
+    return stats
+
+
+def compact_month(
+    kind: PartitionKind, month: str, paths: list[Path], output_dir: Path
+) -> Partition:
+    frames = [frame for path in paths if (frame := read_daily_file(path, kind)).height]
+    mint_column = PARTITION_MINT_COLUMNS[kind]
+    frame = (
+        pl.concat(frames, how="diagonal").sort(mint_column, "date")
+        if frames
+        else pl.DataFrame()
+    )
+
+    file = f"{kind}_{month}.parquet"
+    tmp_file = output_dir / f"{file}.tmp"
+    frame.write_parquet(tmp_file, row_group_size=RESULTS_ROW_GROUP_SIZE)
+    os.replace(tmp_file, output_dir / file)
+
+    mint_keys = (
+        decode_mints(frame[mint_column].drop_nulls().unique()) if frame.height else []
+    )
+    bloom = BloomFilter.from_items(mint_keys, COMPACTION_BLOOM_FALSE_POSITIVE_RATE)
+
+    return Partition(
+        kind=kind,
+        month=month,
+        file=file,
+        rows=frame.height,
+        sources=source_signature(paths),
+        stats=partition_stats(frame, kind) if frame.height else {},
+        bloom=base64.b64encode(bloom.to_bytes()).decode(),
+    )
+
+
+def compact(
+    data_dir: Path = PUMPFUN_DATA_DIR,
+    output_dir: Path = PUMPFUN_COMPACTED_DIR,
+    force: bool = False,
+) -> int:
+    """
+    Merge daily results and activities files into monthly Parquet partitions
+    sorted by mint. Months whose daily files are unchanged since the last
+    run are skipped, and partitions of months without daily files left are
+    removed. Returns the number of partitions written.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / PUMPFUN_COMPACTION_MANIFEST_PATH.name
+    manifest = CompactionManifest.load(manifest_path)
+
+    written = 0
+    for kind in PARTITION_MINT_COLUMNS:
+        months = daily_files(data_dir, kind)
+
+        for key, partition in list(manifest.partitions.items()):
+            if partition.kind == kind and partition.month not in months:
+                (output_dir / partition.file).unlink(missing_ok=True)
+                del manifest.partitions[key]
+                logger.info(f"🗑️ Removed {key}: its daily files are gone")
+
+        for month, paths in months.items():
+            key = f"{kind}_{month}"
+            if not force and partition_is_current(
+                manifest.partitions.get(key), paths, output_dir
+            ):
+                continue
+
+            manifest.partitions[key] = compact_month(kind, month, paths, output_dir)
+            written += 1
+            logger.info(
+                f"🗜️ Compacted {len(paths)} {kind} files into {key} "
+                f"({manifest.partitions[key].rows} rows)"
+            )
+
+    manifest.save(manifest_path)
+
+    return written
+
+
+def current_sources(
+    kind: PartitionKind, data_dir: Path, output_dir: Path
+) -> list[tuple[Partition | None, list[Path]]]:
+    """
+    (partition, daily files) per month. The partition is None when the
+    month was never compacted or its daily files changed since, so readers
+    fall back to the daily files and never serve stale rows.
+    """
+    manifest = CompactionManifest.load(
+        output_dir / PUMPFUN_COMPACTION_MANIFEST_PATH.name
+    )
+    sources: list[tuple[Partition | None, list[Path]]] = []
+    for month, paths in daily_files(data_dir, kind).items():
+        partition = manifest.partitions.get(f"{kind}_{month}")
+        if not partition_is_current(partition, paths, output_dir):
+            partition = None
+        sources.append((partition, paths))
+
+    return sources
+
+
+def find_token(
+    mint: str,
+    data_dir: Path = PUMPFUN_DATA_DIR,
+    output_dir: Path = PUMPFUN_COMPACTED_DIR,
+    kind: PartitionKind = "results",
+) -> pl.DataFrame:
+    """
+    Every row for `mint`, reading only partitions whose filter may hold it,
+    plus the daily files of months not compacted in their current state.
+    """
+    mint_keys = decode_mints([mint])
+    if not mint_keys:
+        raise ValueError(f"Invalid mint address: {mint!r}")
+
+    frames: list[pl.LazyFrame] = []
+    for partition, paths in current_sources(kind, data_dir, output_dir):
+        if partition is None:
+            frames.extend(scan_daily_file(path, kind) for path in paths)
+        elif (
+            partition.rows
+            and partition.overlaps("mint", mint, mint)
+            and partition.might_contain(mint_keys[0])
+        ):
+            frames.append(pl.scan_parquet(output_dir / partition.file))
+
+    mint_column = PARTITION_MINT_COLUMNS[kind]
+    frames = [frame for frame in frames if mint_column in frame.collect_schema()]
+    if not frames:
+        return pl.DataFrame()
+
+    return (
+        pl.concat(frames, how="diagonal").filter(pl.col(mint_column) == mint).collect()
+    )
+
+
+def scan_results(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    column: str | None = None,
+    low: float | None = None,
+    high: float | None = None,
+    data_dir: Path = PUMPFUN_DATA_DIR,
+    output_dir: Path = PUMPFUN_COMPACTED_DIR,
+) -> pl.LazyFrame:
+    """
+    Lazily scan every day's results between two ISO dates, optionally with
+    `column` within [low, high], in `UNIVERSE_SCHEMA`. Compacted months are
+    read from their partition, and partitions ruled out by the manifest
+    statistics are never opened; other months are read from daily files.
+    """
+    frames: list[pl.LazyFrame] = []
+    for partition, paths in current_sources("results", data_dir, output_dir):
+        if partition is None:
+            frames.extend(
+                scan_daily_file(path, "results")
+                for path in paths
+                if (start_date is None or file_date(path) >= start_date)
+                and (end_date is None or file_date(path) <= end_date)
+            )
+        elif (
+            partition.rows
+            and partition.overlaps("date", start_date, end_date)
+            and (column is None or partition.overlaps(column, low, high))
+        ):
+            frames.append(
+                pl.scan_parquet(output_dir / partition.file)
+                .cast(UNIVERSE_SCHEMA, strict=False)
+                .select(list(UNIVERSE_SCHEMA))
+            )
+
+    if not frames:
+        return pl.LazyFrame(schema=UNIVERSE_SCHEMA)
+
+    frame = pl.concat(frames)
+    if start_date is not None:
+        frame = frame.filter(pl.col("date") >= pl.lit(start_date).str.to_date())
+    if end_date is not None:
+        frame = frame.filter(pl.col("date") <= pl.lit(end_date).str.to_date())
+    if column is not None and low is not None:
+        frame = frame.filter(pl.col(column) >= low)
+    if column is not None and high is not None:
+        frame = frame.filter(pl.col(column) <= high)
+
+    return frame
@@ -2,9 +2,19 @@ import datetime
 
 PUMPFUN_BASE_URL = "pump.fun"
 PUMPFUN_COIN_ENDPOINT = "coin"
+PUMPFUN_COIN_ROW_ID = "2"  # RSC row carrying the coin object
 PUMPFUN_LAUNCH_DATE = datetime.datetime(2024, 1, 19, tzinfo=datetime.timezone.utc)
 PUMPFUN_LAUNCH_DATE_TIMESTAMP = "1705622400"
 
+# Token images live on IPFS; Pinata's gateway can resize them
+IPFS_GATEWAY_URL = "https://ipfs.io/ipfs/"
+PINATA_GATEWAY_URL = "https://pump.mypinata.cloud/ipfs/"
+# A CID, optionally followed by a path inside it
+IPFS_PATH_PATTERN = r"[A-Za-z0-9]+(?:/[\w-][\w.-]*)*"
+
 GECKO_TERMINAL_BASE_URL = "app.geckoterminal.com"
 GECKO_TERMINAL_POOLS_ENDPOINT = "/api/p1/solana/pools"
+GECKO_TERMINAL_POOLS_MULTI_ENDPOINT = "/api/p1/solana/pools/multi"
+GECKO_TERMINAL_POOLS_MULTI_LIMIT = 30
 GECKO_TERMINAL_CANDLESTICKS_ENDPOINT = "/api/p1/candlesticks"
+GECKO_TERMINAL_VOLUME_WINDOW = "last_24h"
@@ -0,0 +1,130 @@
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from coin_data.exchanges.pumpfun.activity_export import (
+    EXPORT_WINDOW_SECONDS,
+    WindowedActivityExport,
+)
+from coin_data.exchanges.pumpfun.token_explorer import (
+    EST,
+    PumpfunTokenDataExplorer,
+    Transaction,
+)
+from coin_data.logging import logger
+
+DAEMON_POLL_INTERVAL = 30  # in seconds
+DAEMON_WINDOW_OVERLAP = 120  # in seconds, re-read to cover indexing lag
+
+ProcessTransactions = Callable[[list[Transaction], Path], None]
+
+
+def split_by_day(start_ts: int, end_ts: int) -> list[tuple[str, int, int]]:
+    """Split a time range at EST midnight into (date, start, end) windows."""
+    windows: list[tuple[str, int, int]] = []
+
+    while start_ts <= end_ts:
+        date_str = datetime.fromtimestamp(start_ts, EST).strftime("%Y-%m-%d")
+        _, day_end = PumpfunTokenDataExplorer.get_day_timestamps(date_str)
+        windows.append((date_str, start_ts, min(end_ts, day_end)))
+        start_ts = day_end + 1
+
+    return windows
+
+
+class GraduationDaemon:
+    """
+    Poll the migration account over short overlapping windows and feed new
+    graduations straight into the pipeline, appending to the results file of
+    the EST day they happened on. Activity is fetched through
+    `WindowedActivityExport`, so the backfill after a cold start or downtime
+    is split into windows instead of truncated at solscan's row limit.
+    """
+
+    def __init__(
+        self,
+        explorer: PumpfunTokenDataExplorer,
+        output_dir: Path,
+        process_transactions: ProcessTransactions,
+        poll_interval: int = DAEMON_POLL_INTERVAL,
+        overlap: int = DAEMON_WINDOW_OVERLAP,
+        export_window: int = EXPORT_WINDOW_SECONDS,
+    ) -> None:
+        self.explorer = explorer
+        self.export = WindowedActivityExport(explorer, window_seconds=export_window)
+        self.output_dir = output_dir
+        self.process_transactions = process_transactions
+        self.poll_interval = poll_interval
+        self.overlap = overlap
+        self.last_end: int | None = None
+        # signature -> end of the window it was first seen in
+        self.seen_signatures: dict[str, int] = {}
+
+    def poll_once(self, now: int | None = None) -> int:
+        """Process one window and return the number of new transactions."""
+        end_ts = int(now if now is not None else time.time())
+
+        if self.last_end is None:
+            # Start of the current EST day, so a restart backfills today
+            today = datetime.fromtimestamp(end_ts, EST).strftime("%Y-%m-%d")
+            start_ts, _ = self.explorer.get_day_timestamps(today)
+        else:
+            start_ts = self.last_end - self.overlap
+
+        new_count = 0
+        for date_str, window_start, window_end in split_by_day(start_ts, end_ts):
+            csv_data = self.export.retrieve(window_start, window_end)
+            transactions = self.explorer.convert_csv_to_frame(csv_data).filter(
+                ~pl.col("signature").is_in(list(self.seen_signatures))
+            )
+            new_transactions = self.explorer.convert_frame_to_transactions(
+                self.explorer.unique_mints(transactions)
+            )
+
+            if new_transactions:
+                logger.info(
+                    f"🎓 {len(new_transactions)} new graduations for {date_str}"
+                )
+                results_file = self.output_dir / f"results_{date_str}.csv"
+                self.process_transactions(new_transactions, results_file)
+
+            # Only once processed, so a failed window is retried in full; the
+            # mint index skips any tokens that were already written
+            for signature in transactions["signature"]:
+                self.seen_signatures[signature] = end_ts
+
+            new_count += len(new_transactions)
+
+        self.last_end = end_ts
+
+        # Signatures older than the overlap can no longer be re-read
+        cutoff = end_ts - 2 * self.overlap - self.poll_interval
+        self.seen_signatures = {
+            signature: seen_at
+            for signature, seen_at in self.seen_signatures.items()
+            if seen_at >= cutoff
+        }
+
+        return new_count
+
+    def run(self) -> None:
+        logger.info(
+            f"👀 Watching graduations every {self.poll_interval}s "
+            f"({self.overlap}s overlap)"
+        )
+
+        while True:
+            started = time.monotonic()
+
+            try:
+                self.poll_once()
+            except Exception as e:
+                # last_end is not advanced and the failed window's signatures
+                # were not recorded, so the next poll retries it
+                logger.exception(f"Error polling token activity: {e}")
+
+            elapsed = time.monotonic() - started
+            time.sleep(max(0.0, self.poll_interval - elapsed))
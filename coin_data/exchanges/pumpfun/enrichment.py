@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from coin_data.exchanges.pumpfun.constants import GECKO_TERMINAL_VOLUME_WINDOW
+from coin_data.exchanges.pumpfun.holders import (
+    fetch_24_hour_volume,
+    fetch_total_holders,
+)
+from coin_data.exchanges.pumpfun.market_cap import ResponseData, get_token_data
+from coin_data.logging import logger
+
+# Fields that `process_token` needs on top of the pump.fun coin metadata
+MARKET_CAP_FIELDS = frozenset({"pool_id", "pair_id", "circulating_supply"})
+STATS_FIELDS = frozenset({"volume", "holder_count"})
+REQUIRED_FIELDS = MARKET_CAP_FIELDS | STATS_FIELDS
+
+# Pool attributes read by `extract_pool_fields`; everything else stays raw JSON
+ENRICHMENT_POOL_FIELDS = (
+    "address",
+    "base_token_id",
+    "historical_data",
+    "token_value_data",
+)
+
+
+@dataclass
+class EnrichmentContext:
+    mint: str
+    raydium_pool: str
+    pool_response: ResponseData | None = None
+
+
+@dataclass(frozen=True)
+class EnrichmentSource:
+    name: str
+    provides: frozenset[str]
+    fetch: Callable[[EnrichmentContext], dict[str, Any]]
+
+
+def extract_pool_fields(response: ResponseData) -> dict[str, Any]:
+    """
+    Pull every enrichment field the GeckoTerminal pool payload carries.
+    Fields that are absent or malformed are left out so the planner can
+    fall back to another source.
+    """
+    fields: dict[str, Any] = {}
+    pool = response.data
+    if not pool or not pool.id or pool.id == "default_id":
+        return fields
+
+    fields["pool_id"] = pool.id
+    attributes = pool.attributes
+    base_token_id = attributes.base_token_id
+
+    if pool.relationships and pool.relationships.pairs:
+        try:
+            fields["pair_id"] = pool.relationships.pairs["data"][0]["id"]
+        except (KeyError, IndexError, TypeError):
+            pass
+
+    if base_token_id:
+        fields["base_token_id"] = base_token_id
+
+        circulating_supply = next(
+            (
+                d.attributes.get("circulating_supply")
+                for d in response.included or []
+                if d.id == base_token_id
+            ),
+            None,
+        )
+        if circulating_supply is not None:
+            fields["circulating_supply"] = circulating_supply
+
+        value_data = (attributes.token_value_data or {}).get(base_token_id)
+        if (
+            value_data
+            and value_data.market_cap_in_usd
+            and value_data.market_cap_to_holders_ratio
+        ):
+            fields["holder_count"] = round(
+                float(value_data.market_cap_in_usd)
+                / float(value_data.market_cap_to_holders_ratio)
+            )
+
+    window = (attributes.historical_data or {}).get(GECKO_TERMINAL_VOLUME_WINDOW)
+    if window and window.volume_in_usd is not None:
+        fields["volume"] = int(float(window.volume_in_usd))
+
+    return fields
+
+
+def fetch_geckoterminal_pool(context: EnrichmentContext) -> dict[str, Any]:
+    if context.pool_response is None:
+        context.pool_response = get_token_data(
+            context.raydium_pool, ENRICHMENT_POOL_FIELDS
+        )
+
+    return extract_pool_fields(context.pool_response)
+
+
+def fetch_solscan_volume(context: EnrichmentContext) -> dict[str, Any]:
+    return {"volume": fetch_24_hour_volume(context.raydium_pool)}
+
+
+def fetch_solscan_holders(context: EnrichmentContext) -> dict[str, Any]:
+    return {"holder_count": fetch_total_holders(context.mint)}
+
+
+GECKO_TERMINAL_POOL_SOURCE = EnrichmentSource(
+    name="geckoterminal_pool",
+    provides=frozenset({"base_token_id"}) | REQUIRED_FIELDS,
+    fetch=fetch_geckoterminal_pool,
+)
+SOLSCAN_VOLUME_SOURCE = EnrichmentSource(
+    name="solscan_pool_info",
+    provides=frozenset({"volume"}),
+    fetch=fetch_solscan_volume,
+)
+SOLSCAN_HOLDERS_SOURCE = EnrichmentSource(
+    name="solscan_holders",
+    provides=frozenset({"holder_count"}),
+    fetch=fetch_solscan_holders,
+)
+
+# Ordered by preference: earlier sources win ties in the planner
+ENRICHMENT_SOURCES = (
+    GECKO_TERMINAL_POOL_SOURCE,
+    SOLSCAN_VOLUME_SOURCE,
+    SOLSCAN_HOLDERS_SOURCE,
+)
+
+
+def plan_enrichment(
+    missing: Iterable[str], sources: Iterable[EnrichmentSource]
+) -> list[EnrichmentSource]:
+    """
+    Pick the fewest sources that cover the missing fields (greedy set cover).
+    Fields no source provides are ignored.
+    """
+    remaining = set(missing)
+    candidates = list(sources)
+    plan: list[EnrichmentSource] = []
+
+    while remaining and candidates:
+        best = max(candidates, key=lambda s: len(s.provides & remaining))
+        if not best.provides & remaining:
+            break
+
+        plan.append(best)
+        candidates.remove(best)
+        remaining -= best.provides
+
+    return plan
+
+
+def enrich(
+    context: EnrichmentContext,
+    required: frozenset[str] = REQUIRED_FIELDS,
+    known: dict[str, Any] | None = None,
+    sources: Iterable[EnrichmentSource] = ENRICHMENT_SOURCES,
+) -> dict[str, Any]:
+    """
+    Fill `required` fields with as few upstream calls as possible.
+
+    A prefetched pool response on the context is used without a request. When
+    a source fails or comes back without a field it advertised, the planner
+    re-runs over the untried sources so another one can fill the gap.
+    """
+    fields: dict[str, Any] = dict(known or {})
+    untried = list(sources)
+
+    if context.pool_response is not None:
+        fields = {**extract_pool_fields(context.pool_response), **fields}
+        untried = [s for s in untried if s is not GECKO_TERMINAL_POOL_SOURCE]
+
+    while missing := required - fields.keys():
+        plan = plan_enrichment(missing, untried)
+        if not plan:
+            break
+
+        for source in plan:
+            untried.remove(source)
+            if not source.provides & (required - fields.keys()):
+                continue
+
+            try:
+                fetched = source.fetch(context)
+            except Exception as e:
+                logger.warning(f"⚠️ {source.name} failed for {context.mint}: {e}")
+                continue
+
+            for key, value in fetched.items():
+                fields.setdefault(key, value)
+
+    return fields
@@ -1,24 +1,31 @@
+from contextlib import closing
+
+from coin_data.exchanges.pumpfun.coin_meta import extract_coin_meta_stream
 from coin_data.exchanges.pumpfun.constants import (
     PUMPFUN_BASE_URL,
     PUMPFUN_COIN_ENDPOINT,
 )
 from coin_data.exchanges.pumpfun.encoder import encode_next_router_state_tree
+from coin_data.exchanges.pumpfun.schema import Token
+from coin_data.logging import logger
 from coin_data.requests import APIRequest
 
 
-def fetch_coin_data(mint_id: str) -> str:
-    encoded_tree = encode_next_router_state_tree(mint_id)
+def coin_request_headers(mint_id: str) -> dict[str, str]:
+    return {
+        "accept": "*/*",
+        "user-agent": "Mozilla/5.0",
+        "dnt": "1",
+        "rsc": "1",
+        "next-router-state-tree": encode_next_router_state_tree(mint_id),
+    }
+
 
+def fetch_coin_data(mint_id: str) -> str:
     with APIRequest(PUMPFUN_BASE_URL) as api_request:
         response = api_request.get(
             endpoint=f"{PUMPFUN_COIN_ENDPOINT}/{mint_id}?_rsc=1h9q6",
-            headers={
-                "accept": "*/*",
-                "user-agent": "Mozilla/5.0",
-                "dnt": "1",
-                "rsc": "1",
-                "next-router-state-tree": encoded_tree,
-            },
+            headers=coin_request_headers(mint_id),
         )
 
         response.raise_for_status()
@@ -27,3 +34,40 @@ def fetch_coin_data(mint_id: str) -> str:
             raise ValueError(f"{response.body=}")
 
         return response.body
+
+
+def fetch_coin_meta(mint_id: str) -> Token:
+    """
+    Stream the coin page RSC payload and stop reading once the coin row has
+    been decoded. A stream cut off by a connection error is fetched again
+    in full through `fetch_coin_data`.
+    """
+    try:
+        with APIRequest(PUMPFUN_BASE_URL) as api_request:
+            lines = api_request.iter_lines(
+                endpoint=f"{PUMPFUN_COIN_ENDPOINT}/{mint_id}?_rsc=1h9q6",
+                headers=coin_request_headers(mint_id),
+            )
+
+            with closing(lines):
+                return extract_coin_meta_stream(lines)
+    except OSError as e:
+        logger.warning(f"⚠️ Coin page stream failed for {mint_id}, refetching: {e}")
+
+    body = fetch_coin_data(mint_id)
+    return extract_coin_meta_stream(body.encode().splitlines(keepends=True))
+
+
+def load_coin_meta(mint: str) -> Token | None:
+    """Fetch the pump.fun coin metadata, or None if it cannot be extracted."""
+    try:
+        coin_meta = fetch_coin_meta(mint)
+    except Exception as e:
+        logger.exception(f"Error fetching coin meta for {mint}: {e}")
+        return None
+
+    if not coin_meta.name:
+        logger.error(f"❌ Failed to extract coin meta for: {mint}")
+        return None
+
+    return coin_meta
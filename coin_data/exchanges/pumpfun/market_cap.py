@@ -1,33 +1,37 @@
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
+import dataclasses
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable
 
 from coin_data.exchanges.common import DefaultMixin
 from coin_data.exchanges.pumpfun.constants import (
     GECKO_TERMINAL_BASE_URL,
     GECKO_TERMINAL_POOLS_ENDPOINT,
+    GECKO_TERMINAL_POOLS_MULTI_ENDPOINT,
+    GECKO_TERMINAL_POOLS_MULTI_LIMIT,
 )
-from coin_data.exchanges.pumpfun.ohlc import CandleData
+from coin_data.exchanges.pumpfun.ohlc import Candle, CandleData
 from coin_data.logging import logger
 from coin_data.requests import APIRequest
 
 RelationshipData = dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenReserve(DefaultMixin):
     reserves: str
     reserves_in_usd: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenValueData(DefaultMixin):
     fdv_in_usd: float
     market_cap_in_usd: float
     market_cap_to_holders_ratio: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HistoricalDataEntry(DefaultMixin):
     swaps_count: int
     buyers_count: int
@@ -38,7 +42,7 @@ class HistoricalDataEntry(DefaultMixin):
     sell_swaps_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LockedLiquidity(DefaultMixin):
     locked_percent: float
     next_unlock_percent: float | None
@@ -49,7 +53,7 @@ class LockedLiquidity(DefaultMixin):
     url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GTScoreDetails(DefaultMixin):
     info: float
     pool: float
@@ -58,7 +62,7 @@ class GTScoreDetails(DefaultMixin):
     creation: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HighLowPriceData(DefaultMixin):
     high_price_in_usd_24h: float
     high_price_timestamp_24h: str
@@ -66,7 +70,7 @@ class HighLowPriceData(DefaultMixin):
     low_price_timestamp_24h: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PoolAttributes(DefaultMixin):
     address: str
     name: str
@@ -104,7 +108,73 @@ class PoolAttributes(DefaultMixin):
     suggested_pools_by_liquidity: Any | None = None
 
 
-@dataclass
+def _decode_map(cls: type[DefaultMixin]) -> Callable[[dict[str, Any]], Any]:
+    def decode(value: dict[str, Any]) -> dict[str, Any]:
+        return {key: cls.from_partial(item) for key, item in value.items()}
+
+    return decode
+
+
+# Nested pool attributes that decode into schema objects; the rest stay as JSON
+POOL_ATTRIBUTE_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "token_reserves": _decode_map(TokenReserve),
+    "token_value_data": _decode_map(TokenValueData),
+    "historical_data": _decode_map(HistoricalDataEntry),
+    "locked_liquidity": LockedLiquidity.from_partial,
+    "gt_score_details": GTScoreDetails.from_partial,
+    "high_low_price_data_by_token_id": _decode_map(HighLowPriceData),
+}
+POOL_ATTRIBUTE_FIELDS = frozenset(f.name for f in dataclasses.fields(PoolAttributes))
+
+
+def decode_pool_attribute(name: str, value: Any) -> Any:
+    """Decode one pool attribute; a malformed value decodes to None on its own."""
+    decoder = POOL_ATTRIBUTE_DECODERS.get(name)
+    if value is None or decoder is None:
+        return value
+
+    try:
+        return decoder(value)
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to decode pool attribute {name}: {e}")
+        return None
+
+
+class LazyPoolAttributes:
+    """
+    Projection of `PoolAttributes` over the raw pool JSON.
+
+    Only the declared fields are decoded up front; any other attribute is
+    decoded from the raw payload on first access and memoized.
+    """
+
+    __slots__ = ("_raw", "_decoded")
+
+    def __init__(self, raw: dict[str, Any], fields: Iterable[str] = ()) -> None:
+        self._raw = raw
+        self._decoded: dict[str, Any] = {}
+
+        for name in fields:
+            getattr(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in POOL_ATTRIBUTE_FIELDS:
+            raise AttributeError(name)
+
+        try:
+            return self._decoded[name]
+        except KeyError:
+            value = decode_pool_attribute(name, self._raw.get(name))
+            self._decoded[name] = value
+            return value
+
+    def materialize(self) -> PoolAttributes:
+        return PoolAttributes(
+            **{name: getattr(self, name) for name in POOL_ATTRIBUTE_FIELDS}
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class Relationships(DefaultMixin):
     dex: dict[str, RelationshipData]
     tokens: list[RelationshipData]
@@ -112,44 +182,43 @@ class Relationships(DefaultMixin):
     pairs: dict[Any, list[RelationshipData]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PoolData(DefaultMixin):
     id: str
     type: str
-    attributes: PoolAttributes
+    attributes: PoolAttributes | LazyPoolAttributes
     relationships: Relationships | None
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "PoolData":
+    def from_dict(
+        cls, data: dict[str, Any], fields: Iterable[str] | None = None
+    ) -> "PoolData":
+        """
+        Decode a pool payload. With `fields`, attributes are a lazy projection
+        that only materializes those fields up front.
+        """
         data_item = data.get("data", {})
         if not data_item or isinstance(data_item, list):
             logger.warning("No 'data' field found in the input dictionary.")
             return cls.default()
 
-        attributes_data = data_item.get("attributes", {})
-        relationships_data = data_item.get("relationships", {})
-
-        try:
-            pool_attributes = PoolAttributes(**attributes_data)
-        except TypeError as e:
-            logger.error(f"Failed to initialize PoolAttributes: {e}")
-            pool_attributes = PoolAttributes.default()
+        attributes_data = data_item.get("attributes") or {}
+        relationships_data = data_item.get("relationships") or {}
 
-        try:
-            relationships = Relationships(**relationships_data)
-        except TypeError as e:
-            logger.error(f"Failed to initialize Relationships: {e}")
-            relationships = Relationships.default()
+        if fields is not None:
+            pool_attributes = LazyPoolAttributes(attributes_data, fields)
+        else:
+            pool_attributes = LazyPoolAttributes(attributes_data).materialize()
 
         return cls(
             id=data_item.get("id", "default_id"),
             type=data_item.get("type", "default_type"),
             attributes=pool_attributes,
-            relationships=relationships,
+            relationships=Relationships.from_partial(relationships_data),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncludedData(DefaultMixin):
     id: str
     type: str
@@ -157,20 +226,24 @@ class IncludedData(DefaultMixin):
     relationships: dict[Any, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResponseData(DefaultMixin):
     data: PoolData | None
     included: list[IncludedData] | None
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ResponseData":
+    def from_dict(
+        cls, data: dict[str, Any], fields: Iterable[str] | None = None
+    ) -> "ResponseData":
         return cls(
-            data=PoolData.from_dict(data),
+            data=PoolData.from_dict(data, fields),
             included=[IncludedData(**item) for item in data.get("included", [])],
         )
 
 
-def get_token_data(token_address: str) -> ResponseData:
+def get_token_data(
+    token_address: str, fields: Iterable[str] | None = None
+) -> ResponseData:
     """
     https://app.geckoterminal.com/api/p1/solana/pools/{token_address | raydium_pool}?include=tokens.tags&base_token=0
     """
@@ -182,7 +255,59 @@ def get_token_data(token_address: str) -> ResponseData:
         logger.error(f"Failed to retrieve token data: {response.error}")
         return ResponseData.default()
 
-    return ResponseData.from_dict(response.to_dict()["body"])
+    return ResponseData.from_dict(response.to_dict()["body"], fields)
+
+
+def split_multi_pool_response(
+    body: dict[str, Any], fields: Iterable[str] | None = None
+) -> dict[str, ResponseData]:
+    """Split a multi-pool payload into one `ResponseData` per pool address."""
+    included = [IncludedData(**item) for item in body.get("included", [])]
+    responses: dict[str, ResponseData] = {}
+
+    for item in body.get("data") or []:
+        pool = PoolData.from_dict({"data": item}, fields)
+        address = pool.attributes.address or item.get("attributes", {}).get("address")
+        if address:
+            responses[address] = ResponseData(data=pool, included=included)
+
+    return responses
+
+
+def get_tokens_data(
+    pool_addresses: list[str], fields: Iterable[str] | None = None
+) -> dict[str, ResponseData]:
+    """
+    https://app.geckoterminal.com/api/p1/solana/pools/multi/{raydium_pool},{raydium_pool},...?include=tokens.tags&base_token=0
+
+    Batch variant of `get_token_data`, chunked to the per-call address limit.
+    Pools missing from the response are left out so callers can fall back to
+    a single-pool lookup.
+    """
+    addresses = list(dict.fromkeys(address for address in pool_addresses if address))
+    params = [("include", "tokens.tags"), ("base_token", "0")]
+    responses: dict[str, ResponseData] = {}
+
+    with APIRequest(GECKO_TERMINAL_BASE_URL) as api_request:
+        for start in range(0, len(addresses), GECKO_TERMINAL_POOLS_MULTI_LIMIT):
+            chunk = addresses[start : start + GECKO_TERMINAL_POOLS_MULTI_LIMIT]
+            endpoint = f"{GECKO_TERMINAL_POOLS_MULTI_ENDPOINT}/{','.join(chunk)}"
+            response = api_request.get(endpoint, params)
+
+            if response.error or not isinstance(response.body, dict):
+                logger.error(
+                    f"Failed to retrieve token data for {len(chunk)} pools: "
+                    f"{response.error or response.body}"
+                )
+                continue
+
+            responses.update(
+                split_multi_pool_response(response.to_dict()["body"], fields)
+            )
+
+    logger.info(f"Retrieved {len(responses)}/{len(addresses)} pools from GeckoTerminal")
+
+    return responses
 
 
 def get_relative_time(creation_time: str, event_time: str) -> str:
@@ -192,34 +317,129 @@ def get_relative_time(creation_time: str, event_time: str) -> str:
     return f"+{str(delta)}"
 
 
+@dataclass(slots=True)
+class MarketCapAggregator:
+    """
+    Running market cap extremes for a single token.
+
+    Each candle or trade updates the state in O(1), so intraday monitoring does
+    not need to rescan the whole OHLC history. Prices are kept instead of market
+    caps so a circulating supply change is applied to every figure on the next
+    snapshot. The state round-trips through `to_dict`/`from_dict` (and JSON) to
+    survive restarts.
+    """
+
+    mint: str = ""
+    circulating_supply: float = 0.0
+    creation_time: str | None = None
+    highest_price: float | None = None
+    highest_time: str | None = None
+    lowest_price: float | None = None
+    lowest_time: str | None = None
+    current_price: float | None = None
+    current_time: str | None = None
+    candle_count: int = 0
+
+    @classmethod
+    def from_ohlc(
+        cls, ohlc: CandleData, circulating_supply: float, mint: str = ""
+    ) -> "MarketCapAggregator":
+        aggregator = cls(mint=mint, circulating_supply=circulating_supply)
+        aggregator.update_candles(ohlc.data or [])
+        return aggregator
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "MarketCapAggregator":
+        return cls(**data)
+
+    @classmethod
+    def from_json(cls, data: str) -> "MarketCapAggregator":
+        return cls.from_dict(json.loads(data))
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @property
+    def current_timestamp(self) -> int | None:
+        """Epoch seconds of the latest folded candle, to resume from."""
+        if self.current_time is None:
+            return None
+
+        # Candle times without an offset are UTC, not local time
+        dt = datetime.fromisoformat(self.current_time)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp())
+
+    def set_circulating_supply(self, circulating_supply: float) -> None:
+        self.circulating_supply = circulating_supply
+
+    def update_candle(self, candle: Candle) -> None:
+        """Fold a single OHLC candle into the running extremes."""
+        dt = datetime.fromisoformat(candle.dt)
+
+        if self.creation_time is None or dt < datetime.fromisoformat(
+            self.creation_time
+        ):
+            self.creation_time = candle.dt
+
+        # Strict comparisons keep the earliest candle on ties, matching max()/min()
+        if self.highest_price is None or candle.h > self.highest_price:
+            self.highest_price = candle.h
+            self.highest_time = candle.dt
+
+        if self.lowest_price is None or candle.l < self.lowest_price:
+            self.lowest_price = candle.l
+            self.lowest_time = candle.dt
+
+        # A re-sent candle for the current period replaces the partial one
+        if self.current_time is None or dt >= datetime.fromisoformat(self.current_time):
+            self.current_price = candle.c
+            self.current_time = candle.dt
+
+        self.candle_count += 1
+
+    def update_candles(self, candles: list[Candle]) -> None:
+        for candle in candles:
+            self.update_candle(candle)
+
+    def update_trade(self, price: float, dt: str) -> None:
+        """Fold a single trade price (ISO timestamp) into the running extremes."""
+        self.update_candle(Candle(dt=dt, o=price, h=price, l=price, c=price, v=0.0))
+
+    def market_cap(self, price: float | None) -> float:
+        return round((price or 0) * self.circulating_supply, 2)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the same mapping as `get_market_cap_with_times`."""
+        if self.creation_time is None:
+            return {}
+
+        creation_time = self.creation_time
+
+        return {
+            "highest_market_cap": self.market_cap(self.highest_price),
+            "highest_market_cap_time": get_relative_time(
+                creation_time, self.highest_time or creation_time
+            ),
+            "lowest_market_cap": self.market_cap(self.lowest_price),
+            "lowest_market_cap_time": get_relative_time(
+                creation_time, self.lowest_time or creation_time
+            ),
+            "current_market_cap": self.market_cap(self.current_price),
+            "current_market_cap_time": get_relative_time(
+                creation_time, self.current_time or creation_time
+            ),
+        }
+
+
 def get_market_cap_with_times(
     ohlc: CandleData, circulating_supply: float
 ) -> dict[str, Any]:
-    if not ohlc.data:
-        return {}
-
-    creation_time = ohlc.data[0].dt
-
-    highest_candle = max(ohlc.data, key=lambda x: x.h)
-    highest_market_cap = round(highest_candle.h * circulating_supply, 2)
-    highest_time = get_relative_time(creation_time, highest_candle.dt)
-
-    lowest_candle = min(ohlc.data, key=lambda x: x.l)
-    lowest_market_cap = round(lowest_candle.l * circulating_supply, 2)
-    lowest_time = get_relative_time(creation_time, lowest_candle.dt)
-
-    current_candle = ohlc.data[-1]
-    current_market_cap = round(current_candle.c * circulating_supply, 2)
-    current_time = get_relative_time(creation_time, current_candle.dt)
-
-    return {
-        "highest_market_cap": highest_market_cap,
-        "highest_market_cap_time": highest_time,
-        "lowest_market_cap": lowest_market_cap,
-        "lowest_market_cap_time": lowest_time,
-        "current_market_cap": current_market_cap,
-        "current_market_cap_time": current_time,
-    }
+    return MarketCapAggregator.from_ohlc(ohlc, circulating_supply).snapshot()
 
 
 if __name__ == "__main__":
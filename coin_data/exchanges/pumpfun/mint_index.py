@@ -0,0 +1,207 @@
+import dataclasses
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Literal
+
+from coin_data.config import PUMPFUN_DATA_DIR, PUMPFUN_MINT_INDEX_PATH
+from coin_data.exchanges.pumpfun.cache import SQLITE_MAX_VARIABLES, MintKeyedStore
+from coin_data.exchanges.pumpfun.schema import Token
+from coin_data.exchanges.pumpfun.sinks import (
+    existing_results_path,
+    read_results,
+    results_files,
+)
+from coin_data.utils.bloom import BloomFilter
+from coin_data.utils.mint_key import (
+    decode_mint,
+    decode_mints,
+    encode_mint,
+    is_valid_mint,
+)
+
+# Bump when the stored layout changes; stale rows are dropped on open
+MINT_INDEX_VERSION = 2
+MINT_INDEX_BLOOM_FALSE_POSITIVE_RATE = 0.001
+
+MintStatus = Literal["success", "failed"]
+
+
+def content_hash(row: dict[str, Any]) -> str:
+    """
+    Stable digest of a results row, to tell rewritten rows apart. Values are
+    hashed as the CSV writer stores them, so a `Token` and the row read back
+    with `read_results` agree.
+    """
+    cells = {key: "" if value is None else str(value) for key, value in row.items()}
+    payload = json.dumps(cells, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def results_date(results_file: Path) -> str:
+    """`results_2025-01-31.csv` -> `2025-01-31`"""
+    return results_file.stem.removeprefix("results_")
+
+
+@dataclass(slots=True, frozen=True)
+class MintIndexEntry:
+    mint: str
+    date: str
+    status: MintStatus
+    content_hash: str
+
+
+class MintIndex(MintKeyedStore):
+    """
+    Every mint the scraper has processed, on any day, with the date of the
+    results file it went to, whether it succeeded and a hash of its row.
+
+    Mints are keyed by their 32-byte form and lookups hit the primary key;
+    invalid addresses are never stored. An empty index is seeded from every
+    results file in `data_dir`. With `bloom=True` an in-memory Bloom filter
+    of successful mints answers most misses without touching SQLite, which
+    pays off for backfills over many days.
+    """
+
+    table = "mint_index"
+    columns = "date TEXT NOT NULL, status TEXT NOT NULL, content_hash TEXT NOT NULL"
+    version = MINT_INDEX_VERSION
+
+    def __init__(
+        self,
+        path: Path = PUMPFUN_MINT_INDEX_PATH,
+        bloom: bool = False,
+        data_dir: Path = PUMPFUN_DATA_DIR,
+    ):
+        super().__init__(path)
+        self.conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_date ON {self.table} (date)"
+        )
+        self.conn.commit()
+
+        self.bloom: BloomFilter | None = None
+        if self.is_empty() and data_dir.exists():
+            for results_file in results_files(data_dir):
+                self.index_results_file(results_file)
+
+        if bloom:
+            with self.lock:
+                keys = [
+                    row[0]
+                    for row in self.conn.execute(
+                        f"SELECT key FROM {self.table} WHERE status = 'success'"
+                    )
+                ]
+            # Headroom for the mints added while the index is open
+            self.bloom = BloomFilter.for_capacity(
+                2 * len(keys) + 10_000, MINT_INDEX_BLOOM_FALSE_POSITIVE_RATE
+            )
+            self.bloom.update(keys)
+
+    def __contains__(self, mint: str) -> bool:
+        """Whether the mint was processed successfully on any day."""
+        if not is_valid_mint(mint):
+            return False
+        if self.bloom is not None and decode_mint(mint) not in self.bloom:
+            return False
+
+        entry = self.get(mint)
+        return entry is not None and entry.status == "success"
+
+    def is_empty(self) -> bool:
+        with self.lock:
+            row = self.conn.execute(f"SELECT 1 FROM {self.table} LIMIT 1").fetchone()
+        return row is None
+
+    def get(self, mint: str) -> MintIndexEntry | None:
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT date, status, content_hash FROM {self.table} WHERE key = ?",
+                (decode_mint(mint),),
+            ).fetchone()
+
+        return MintIndexEntry(mint, *row) if row else None
+
+    def processed(self, mints: Iterable[str]) -> set[str]:
+        """The subset of `mints` already processed successfully."""
+        candidates = list(dict.fromkeys(decode_mints(mints)))
+        if self.bloom is not None:
+            candidates = [key for key in candidates if key in self.bloom]
+
+        found: set[str] = set()
+        for start in range(0, len(candidates), SQLITE_MAX_VARIABLES):
+            chunk = candidates[start : start + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT key FROM {self.table} "
+                    f"WHERE status = 'success' AND key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+
+            found.update(encode_mint(row[0]) for row in rows)
+
+        return found
+
+    def count(self, date: str) -> int:
+        with self.lock:
+            return self.conn.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE date = ?", (date,)
+            ).fetchone()[0]
+
+    def record(
+        self, mint: str, date: str, status: MintStatus, row_hash: str = ""
+    ) -> None:
+        key = decode_mint(mint)
+
+        # A failure never demotes a mint that already has a written row
+        with self.lock:
+            self.conn.execute(
+                f"INSERT INTO {self.table} (key, date, status, content_hash) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "date = excluded.date, status = excluded.status, "
+                "content_hash = excluded.content_hash "
+                "WHERE excluded.status = 'success' "
+                f"OR {self.table}.status != 'success'",
+                (key, date, status, row_hash),
+            )
+            self.conn.commit()
+
+            if status == "success" and self.bloom is not None:
+                self.bloom.add(key)
+
+    def record_token(self, token: Token, date: str) -> None:
+        self.record(
+            token.mint, date, "success", content_hash(dataclasses.asdict(token))
+        )
+
+    def index_results_file(self, results_file: Path) -> int:
+        """
+        Add the rows of a results file written before the index existed.
+        Skipped once the index has entries for that day.
+        """
+        date = results_date(results_file)
+        path = existing_results_path(results_file)
+        if path is None or self.count(date):
+            return 0
+
+        entries = [
+            (decode_mint(row["mint"]), date, content_hash(row))
+            for row in read_results(path).iter_rows(named=True)
+            if is_valid_mint(row["mint"] or "")
+        ]
+
+        with self.lock:
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table} "
+                "(key, date, status, content_hash) VALUES (?, ?, 'success', ?)",
+                entries,
+            )
+            self.conn.commit()
+
+            if self.bloom is not None:
+                self.bloom.update(entry[0] for entry in entries)
+
+        return len(entries)
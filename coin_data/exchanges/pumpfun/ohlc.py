@@ -13,8 +13,11 @@ from coin_data.exchanges.pumpfun.constants import (
 from coin_data.logging import logger
 from coin_data.requests import APIRequest
 
+OHLC_RESOLUTION = "15"  # in minutes
+OHLC_CANDLE_SECONDS = 15 * 60
 
-@dataclass
+
+@dataclass(slots=True)
 class Candle(DefaultMixin):
     dt: str
     o: float
@@ -24,7 +27,7 @@ class Candle(DefaultMixin):
     v: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandleData(DefaultMixin):
     meta: dict[str, Any]
     data: list[Candle]
@@ -35,17 +38,35 @@ class CandleData(DefaultMixin):
         return cls(meta=d.get("meta", {}), data=candles)
 
 
-def get_ohlc(pool_id: str, pair_id: str) -> CandleData:
+def get_ohlc(
+    pool_id: str, pair_id: str, from_timestamp: int | None = None
+) -> CandleData:
     """
     https://app.geckoterminal.com/api/p1/candlesticks/{pool_id}/{pair_id}?resolution=60&from_timestamp=1451606400&to_timestamp=1735109774&for_update=false&currency=usd&is_inverted=false
+
+    `from_timestamp` limits the request to candles since then (inclusive), for
+    incremental updates; the default is the whole history since launch.
     """
     endpoint = f"{GECKO_TERMINAL_CANDLESTICKS_ENDPOINT}/{pool_id}/{pair_id}"
     current_timestamp = str(int(time.time()))
     current_date = datetime.datetime.now(datetime.timezone.utc)
-    count_back = str(int((current_date - PUMPFUN_LAUNCH_DATE).total_seconds() // 3600))
+
+    if from_timestamp is None:
+        start_timestamp = PUMPFUN_LAUNCH_DATE_TIMESTAMP
+        start_date = PUMPFUN_LAUNCH_DATE
+    else:
+        start_timestamp = str(from_timestamp)
+        start_date = datetime.datetime.fromtimestamp(
+            from_timestamp, datetime.timezone.utc
+        )
+
+    # One candle per resolution period, counting the partial one in progress
+    count_back = str(
+        int((current_date - start_date).total_seconds() // OHLC_CANDLE_SECONDS) + 1
+    )
     params = [
-        ("resolution", "15"),
-        ("from_timestamp", PUMPFUN_LAUNCH_DATE_TIMESTAMP),
+        ("resolution", OHLC_RESOLUTION),
+        ("from_timestamp", start_timestamp),
         ("to_timestamp", current_timestamp),
         ("for_update", "false"),
         ("count_back", count_back),
@@ -0,0 +1,234 @@
+import concurrent.futures
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from coin_data.exchanges.pumpfun.cache import (
+    IdentityCache,
+    MarketCapStateCache,
+    TokenIdentity,
+)
+from coin_data.exchanges.pumpfun.enrichment import (
+    ENRICHMENT_POOL_FIELDS,
+    MARKET_CAP_FIELDS,
+    STATS_FIELDS,
+    EnrichmentContext,
+    enrich,
+)
+from coin_data.exchanges.pumpfun.general import load_coin_meta
+from coin_data.exchanges.pumpfun.market_cap import (
+    MarketCapAggregator,
+    ResponseData,
+    get_tokens_data,
+)
+from coin_data.exchanges.pumpfun.ohlc import get_ohlc
+from coin_data.exchanges.pumpfun.sinks import (
+    RESULTS_SCHEMA,
+    ResultsLock,
+    read_results,
+    results_path,
+    write_results,
+)
+from coin_data.logging import logger
+from coin_data.utils.mint_key import is_valid_mint
+
+# Result columns that change after a token was first scraped
+REFRESH_COLUMNS = (
+    "volume",
+    "holder_count",
+    "highest_market_cap",
+    "highest_market_cap_timestamp",
+    "lowest_market_cap",
+    "lowest_market_cap_timestamp",
+    "current_market_cap",
+    "current_market_cap_timestamp",
+)
+REFRESH_MAX_WORKERS = 8
+
+
+def resolve_identity(
+    mint: str, identity_cache: IdentityCache
+) -> tuple[TokenIdentity | None, ResponseData | None]:
+    """
+    Cached identity, or resolve it once for rows that predate the cache.
+    Also returns the pool response fetched while resolving, if any, so the
+    caller can reuse it.
+    """
+    identity = identity_cache.get(mint)
+    if identity is not None:
+        return identity, None
+
+    coin_meta = load_coin_meta(mint)
+    if coin_meta is None:
+        return None, None
+
+    context = EnrichmentContext(mint=mint, raydium_pool=coin_meta.raydium_pool)
+    fields = enrich(context, required=MARKET_CAP_FIELDS)
+    if MARKET_CAP_FIELDS - fields.keys():
+        logger.error(f"❌ Missing pool data for: {mint}")
+        return None, context.pool_response
+
+    identity = TokenIdentity.from_token(coin_meta, fields)
+    identity_cache.put(identity)
+
+    return identity, context.pool_response
+
+
+def refresh_token(
+    mint: str,
+    identity_cache: IdentityCache,
+    state_cache: MarketCapStateCache,
+    pool_response: ResponseData | None = None,
+) -> dict[str, Any] | None:
+    """
+    Fetch only what changed for a known mint: candles since the last refresh,
+    holder count and volume. Returns the new `REFRESH_COLUMNS` values.
+    """
+    try:
+        identity, resolved_pool_response = resolve_identity(mint, identity_cache)
+        if identity is None:
+            return None
+        if pool_response is None:
+            pool_response = resolved_pool_response
+
+        state = state_cache.get(mint)
+        if state is None:
+            state = MarketCapAggregator(
+                mint=mint, circulating_supply=identity.circulating_supply
+            )
+
+        ohlc_data = get_ohlc(
+            identity.pool_id, identity.pair_id, state.current_timestamp
+        )
+        state.update_candles(ohlc_data.data or [])
+        if state.candle_count:
+            state_cache.put(state)
+
+        context = EnrichmentContext(
+            mint=mint, raydium_pool=identity.raydium_pool, pool_response=pool_response
+        )
+        stats = enrich(context, required=STATS_FIELDS)
+        market_cap = state.snapshot()
+
+        values: dict[str, Any] = {}
+        if market_cap:
+            values.update(
+                {
+                    "highest_market_cap": market_cap["highest_market_cap"],
+                    "highest_market_cap_timestamp": market_cap[
+                        "highest_market_cap_time"
+                    ],
+                    "lowest_market_cap": market_cap["lowest_market_cap"],
+                    "lowest_market_cap_timestamp": market_cap["lowest_market_cap_time"],
+                    "current_market_cap": market_cap["current_market_cap"],
+                    "current_market_cap_timestamp": market_cap[
+                        "current_market_cap_time"
+                    ],
+                }
+            )
+
+        # Keep previous figures rather than overwrite them after a failed fetch
+        for field in STATS_FIELDS & stats.keys():
+            values[field] = stats[field]
+
+        return values
+
+    except Exception as e:
+        logger.exception(f"Error refreshing token {mint}: {e}")
+        return None
+
+
+def refresh_results_file(
+    results_file: Path,
+    identity_cache: IdentityCache,
+    state_cache: MarketCapStateCache,
+    max_workers: int = REFRESH_MAX_WORKERS,
+) -> int:
+    """
+    Refresh the volatile columns of a results file (CSV or Parquet) in place.
+    The file is swapped atomically, and only when a value changed. Returns
+    the number of updated rows.
+
+    The day's `ResultsLock` is held throughout, so no sink can append rows
+    that the swap would drop. A day a scrape or the daemon is writing is
+    skipped.
+    """
+    with ResultsLock(results_file, blocking=False) as lock:
+        if not lock.acquired:
+            logger.warning(f"⚠️ Skipping {results_file}: it is being written")
+            return 0
+
+        return refresh_locked_results_file(
+            results_file, identity_cache, state_cache, max_workers
+        )
+
+
+def refresh_locked_results_file(
+    results_file: Path,
+    identity_cache: IdentityCache,
+    state_cache: MarketCapStateCache,
+    max_workers: int,
+) -> int:
+    frame = read_results(results_file)
+    rows = frame.to_dicts()
+
+    mints = list(
+        dict.fromkeys(row["mint"] for row in rows if is_valid_mint(row["mint"] or ""))
+    )
+    identities = identity_cache.get_many(mints)
+    pool_responses = get_tokens_data(
+        [identity.raydium_pool for identity in identities.values()],
+        ENRICHMENT_POOL_FIELDS,
+    )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            mint: executor.submit(
+                refresh_token,
+                mint,
+                identity_cache,
+                state_cache,
+                pool_responses.get(identities[mint].raydium_pool)
+                if mint in identities
+                else None,
+            )
+            for mint in mints
+        }
+        updates = {mint: future.result() for mint, future in futures.items()}
+
+    updated_rows = 0
+    for row in rows:
+        values = updates.get(row["mint"])
+        if not values:
+            continue
+
+        changed = False
+        for column in REFRESH_COLUMNS:
+            if column in values and row[column] != values[column]:
+                row[column] = values[column]
+                changed = True
+
+        updated_rows += changed
+
+    if updated_rows:
+        refreshed = pl.DataFrame(rows, schema=RESULTS_SCHEMA, strict=False)
+        write_results(results_file, refreshed)
+
+        csv_export = results_path(results_file, "csv")
+        if results_file.suffix == ".parquet" and csv_export.exists():
+            write_results(csv_export, refreshed)
+
+    logger.info(f"🔄 Refreshed {results_file}: {updated_rows}/{len(rows)} rows updated")
+
+    return updated_rows
+
+
+def refresh_results(
+    results_files: list[Path], max_workers: int = REFRESH_MAX_WORKERS
+) -> int:
+    with IdentityCache() as identity_cache, MarketCapStateCache() as state_cache:
+        return sum(
+            refresh_results_file(path, identity_cache, state_cache, max_workers)
+            for path in results_files
+        )
@@ -1,13 +1,13 @@
 import concurrent.futures
-import glob
 import json
 import os
 import re
 from dataclasses import dataclass
+from pathlib import Path
 
 import openai
-import polars as pl
 
+from coin_data.exchanges.pumpfun.sinks import read_results, results_files
 from coin_data.logging import logger
 
 DATA_DIR = os.path.expanduser("~/pumpfun_data/")
@@ -26,15 +26,16 @@ client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 def read_csv_to_markdown(csv_path: str) -> str:
     """
-    Reads a CSV file using Polars and converts it into a Markdown table.
+    Reads a results file (CSV or Parquet) using Polars and converts it into a
+    Markdown table.
 
     Args:
-        csv_path (str): Path to the CSV file.
+        csv_path (str): Path to the results file.
 
     Returns:
-        str: CSV data formatted as a Markdown table.
+        str: Results data formatted as a Markdown table.
     """
-    df = pl.read_csv(csv_path)
+    df = read_results(Path(csv_path))
     return df.to_pandas().to_markdown(index=False)
 
 
@@ -161,12 +162,13 @@ def process_csv_file(csv_file: str, report_file: str) -> ProcessCsvResponse:
 
 def generate_reports() -> list[ProcessCsvResponse]:
     """
-    Processes all CSV files matching `results_*.csv` and generates reports using multithreading.
+    Processes every day's results file (CSV or Parquet) and generates reports
+    using multithreading.
 
     Returns:
         list: A list of dictionaries containing report generation statuses.
     """
-    csv_files = glob.glob(os.path.join(DATA_DIR, "results_*.csv"))
+    csv_files = [str(path) for path in results_files(Path(DATA_DIR))]
 
     if not csv_files:
         return [ProcessCsvResponse(status="error", message="No CSV files found.")]
@@ -178,9 +180,7 @@ def generate_reports() -> list[ProcessCsvResponse]:
         report_files = [
             os.path.join(
                 OUTPUT_DIR,
-                os.path.basename(csv)
-                .replace("results_", "report_")
-                .replace(".csv", ".json"),
+                Path(csv).with_suffix(".json").name.replace("results_", "report_"),
             )
             for csv in csv_files
         ]
@@ -2,14 +2,14 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokensInfo:
     token: str
     token_account: str
     amount: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TotalVolume24h:
     total_volume_24h: int
     total_volume_change_24h: float
@@ -22,7 +22,7 @@ class TotalVolume24h:
     tokens_info: TokensInfo | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Volume:
     success: bool
     data: TotalVolume24h
@@ -37,14 +37,14 @@ class Volume:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HolderTotal:
     success: bool
     data: int
     metadata: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Link:
     backward: float
     forward: float
@@ -52,13 +52,13 @@ class Link:
     target: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Metadata:
     max_amount: int
     min_amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Holder:
     address: str
     amount: int
@@ -78,6 +78,9 @@ class Holder:
         percentage: float = 0.0,
         token_account: str = "",
         transaction_count: int = 0,
+        ignore: bool | None = False,
+        is_exchange: bool | None = False,
+        name: str | None = None,
     ):
         self.address = address
         self.amount = amount
@@ -85,9 +88,12 @@ class Holder:
         self.percentage = percentage
         self.token_account = token_account
         self.transaction_count = transaction_count
+        self.ignore = ignore
+        self.is_exchange = is_exchange
+        self.name = name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenLink:
     address: str
     decimals: int
@@ -96,7 +102,7 @@ class TokenLink:
     symbol: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BubbleGraphData:
     chain: str
     dt_update: str
@@ -114,7 +120,7 @@ class BubbleGraphData:
     version: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     name: str
     symbol: str
@@ -125,11 +131,77 @@ class Token:
     telegram: str
     twitter: str
     website: str
-    created_timestamp: str
+    created_timestamp: int  # epoch milliseconds
     raydium_pool: str
-    highest_market_cap: int
-    highest_market_cap_timestamp: int
-    lowest_market_cap: int
-    lowest_market_cap_timestamp: int
-    current_market_cap: int
-    current_market_cap_timestamp: int
+    highest_market_cap: float
+    highest_market_cap_timestamp: str  # relative to creation, "+H:MM:SS"
+    lowest_market_cap: float
+    lowest_market_cap_timestamp: str
+    current_market_cap: float
+    current_market_cap_timestamp: str
+
+
+if __name__ == "__main__":
+    # Micro-benchmark: slotted schema types vs. their `__dict__`-backed
+    # equivalents over a day's worth of tokens, plus cached defaults.
+    import dataclasses
+    import timeit
+    import tracemalloc
+    from typing import Callable
+
+    from coin_data.exchanges.pumpfun.market_cap import PoolAttributes
+    from coin_data.exchanges.pumpfun.ohlc import Candle
+
+    TOKENS_PER_DAY = 500
+    CANDLES_PER_TOKEN = 1_000
+
+    def unslotted(cls: type) -> type:
+        return dataclasses.make_dataclass(
+            f"Dict{cls.__name__}",
+            [(f.name, f.type) for f in dataclasses.fields(cls)],
+        )
+
+    def measure(build: Callable[[], Any], count: int) -> tuple[float, float]:
+        tracemalloc.start()
+        instances = [build() for _ in range(count)]
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        seconds = min(timeit.repeat(build, number=count, repeat=3))
+        return memory / count, seconds
+
+    token_kwargs = {f.name: 0 for f in dataclasses.fields(Token)}
+    candle_kwargs = {
+        "dt": "2025-01-01T00:00:00",
+        "o": 1,
+        "h": 1,
+        "l": 1,
+        "c": 1,
+        "v": 1,
+    }
+    cases = [
+        ("Token", Token, token_kwargs, TOKENS_PER_DAY),
+        ("Candle", Candle, candle_kwargs, TOKENS_PER_DAY * CANDLES_PER_TOKEN),
+    ]
+
+    for label, cls, kwargs, count in cases:
+        dict_cls = unslotted(cls)
+        dict_bytes, dict_seconds = measure(lambda: dict_cls(**kwargs), count)
+        slot_bytes, slot_seconds = measure(lambda: cls(**kwargs), count)
+        print(
+            f"{label} x{count}: {dict_bytes:.0f} -> {slot_bytes:.0f} bytes/instance, "
+            f"{dict_seconds:.3f}s -> {slot_seconds:.3f}s"
+        )
+
+    def uncached_default() -> PoolAttributes:
+        return PoolAttributes(
+            **{
+                f.name: (f.default if f.default != dataclasses.MISSING else None)
+                for f in dataclasses.fields(PoolAttributes)
+            }
+        )
+
+    count = TOKENS_PER_DAY * 10
+    uncached = min(timeit.repeat(uncached_default, number=count, repeat=3))
+    cached = min(timeit.repeat(PoolAttributes.default, number=count, repeat=3))
+    print(f"PoolAttributes.default() x{count}: {uncached:.3f}s -> {cached:.3f}s")
@@ -0,0 +1,315 @@
+import csv
+import dataclasses
+import fcntl
+import os
+import typing
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import TracebackType
+from typing import Iterable, Literal, Optional, Self, Type
+
+import polars as pl
+
+from coin_data.config import PUMPFUN_PARQUET_RESULTS_PATTERN, PUMPFUN_RESULTS_PATTERN
+from coin_data.exchanges.pumpfun.schema import Token
+
+ResultsFormat = Literal["csv", "parquet"]
+
+RESULTS_FORMATS: tuple[ResultsFormat, ...] = ("csv", "parquet")
+RESULTS_ROW_GROUP_SIZE = 256
+
+_POLARS_TYPES: dict[type, pl.DataType] = {
+    int: pl.Int64(),
+    float: pl.Float64(),
+    str: pl.Utf8(),
+}
+
+# Fixed results schema, in `Token` field order
+RESULTS_SCHEMA: dict[str, pl.DataType] = {
+    name: _POLARS_TYPES[annotation]
+    for name, annotation in typing.get_type_hints(Token).items()
+}
+RESULTS_COLUMNS = list(RESULTS_SCHEMA)
+
+
+def results_path(results_file: Path, results_format: ResultsFormat) -> Path:
+    """`results_2025-01-31.csv` -> `results_2025-01-31.parquet`"""
+    return results_file.with_suffix(f".{results_format}")
+
+
+def existing_results_path(results_file: Path) -> Path | None:
+    """The day's results file in either format, preferring Parquet."""
+    for results_format in reversed(RESULTS_FORMATS):
+        path = results_path(results_file, results_format)
+        if path.exists():
+            return path
+    return None
+
+
+def results_files(data_dir: Path) -> list[Path]:
+    """One results file per day in `data_dir`, preferring Parquet."""
+    days = {
+        path.with_suffix(".csv")
+        for pattern in (PUMPFUN_RESULTS_PATTERN, PUMPFUN_PARQUET_RESULTS_PATTERN)
+        for path in data_dir.glob(pattern)
+    }
+    return sorted(path for day in days if (path := existing_results_path(day)))
+
+
+def source_signature(paths: Iterable[Path]) -> dict[str, list[int]]:
+    """File name -> [size, mtime_ns], to tell when derived files are stale."""
+    signature: dict[str, list[int]] = {}
+    for path in paths:
+        stat = path.stat()
+        signature[path.name] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def tokens_to_frame(tokens: Iterable[Token]) -> pl.DataFrame:
+    return pl.DataFrame(
+        [dataclasses.astuple(token) for token in tokens],
+        schema=RESULTS_SCHEMA,
+        orient="row",
+        strict=False,
+    )
+
+
+def read_results(path: Path, columns: list[str] | None = None) -> pl.DataFrame:
+    """
+    Load a results file of either format with the `RESULTS_SCHEMA` types,
+    reading only `columns` when given.
+    """
+    columns = columns or RESULTS_COLUMNS
+    schema = {column: RESULTS_SCHEMA[column] for column in columns}
+
+    if path.suffix == ".parquet":
+        return pl.read_parquet(path, columns=columns).cast(schema, strict=False)
+
+    try:
+        frame = pl.read_csv(path, columns=columns, infer_schema=False)
+    except pl.exceptions.NoDataError:
+        return pl.DataFrame(schema=schema)
+
+    # Legacy rows may hold placeholders such as "" in numeric columns
+    return frame.cast(schema, strict=False)
+
+
+def scan_results_file(path: Path) -> pl.LazyFrame:
+    """Lazy counterpart of `read_results`, so queries can push down."""
+    if path.suffix == ".parquet":
+        return pl.scan_parquet(path).cast(RESULTS_SCHEMA, strict=False)
+
+    if path.stat().st_size == 0:
+        return pl.LazyFrame(schema=RESULTS_SCHEMA)
+
+    return (
+        pl.scan_csv(path, infer_schema=False)
+        .select(RESULTS_COLUMNS)
+        .cast(RESULTS_SCHEMA, strict=False)
+    )
+
+
+def results_parts_dir(path: Path) -> Path:
+    """`results_2025-01-31.parquet` -> `results_2025-01-31.parquet.parts`"""
+    return path.with_name(path.name + ".parts")
+
+
+def results_parts(path: Path) -> list[Path]:
+    """Row groups committed to a Parquet results file but not yet merged in."""
+    parts_dir = results_parts_dir(path)
+    if not parts_dir.is_dir():
+        return []
+    return sorted(parts_dir.glob("*.parquet"))
+
+
+def write_results(path: Path, frame: pl.DataFrame) -> None:
+    """Replace a results file atomically."""
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    if path.suffix == ".parquet":
+        frame.write_parquet(tmp_file, row_group_size=RESULTS_ROW_GROUP_SIZE)
+    else:
+        frame.write_csv(tmp_file)
+    os.replace(tmp_file, path)
+
+
+class ResultsLock:
+    """
+    Exclusive lock on a day's results, shared by every process through a
+    `results_{date}.lock` file next to them. Sinks hold it while open and
+    refreshes while they rewrite the file, so neither loses the other's rows.
+    With `blocking=False`, check `acquired` after entering.
+    """
+
+    def __init__(self, results_file: Path, blocking: bool = True) -> None:
+        self.path = results_file.with_suffix(".lock")
+        self.blocking = blocking
+        self.file = None
+        self.acquired = False
+
+    def __enter__(self) -> Self:
+        self.file = open(self.path, "a")
+        flags = fcntl.LOCK_EX if self.blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self.file, flags)
+            self.acquired = True
+        except BlockingIOError:
+            self.acquired = False
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        # Closing the file releases the lock
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.acquired = False
+
+
+class ResultsSink(ABC):
+    """
+    Destination for processed tokens. `write` and `flush` return the tokens
+    they made durable, so callers can record exactly what was committed.
+    Not thread-safe; `update_results_csv` serializes writes under its lock.
+    The day's `ResultsLock` is held from construction until the sink exits.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = ResultsLock(path).__enter__()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        try:
+            self.close()
+        finally:
+            self.lock.__exit__(exc_type, exc_val, exc_tb)
+
+    @abstractmethod
+    def write(self, token: Token) -> list[Token]:
+        pass
+
+    def flush(self) -> list[Token]:
+        return []
+
+    def close(self) -> list[Token]:
+        return self.flush()
+
+
+class CsvResultsSink(ResultsSink):
+    """Append rows to a results CSV, flushing each one as it is written."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        is_new_file = not path.exists() or path.stat().st_size == 0
+        self.file = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=RESULTS_COLUMNS)
+
+        if is_new_file:
+            self.writer.writeheader()
+
+    def write(self, token: Token) -> list[Token]:
+        self.writer.writerow(dataclasses.asdict(token))
+        self.file.flush()
+        return [token]
+
+    def close(self) -> list[Token]:
+        self.file.close()
+        return []
+
+
+class ParquetResultsSink(ResultsSink):
+    """
+    Buffer rows into row groups of `row_group_size` and commit each group as
+    its own part file next to the day's Parquet file. On close the parts are
+    merged into the day's file with one atomic rewrite; with `csv_export`, a
+    CSV copy is replaced alongside it. Parts left by an interrupted run are
+    merged when the sink is next opened.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        row_group_size: int = RESULTS_ROW_GROUP_SIZE,
+        csv_export: bool = False,
+    ) -> None:
+        super().__init__(path)
+        self.row_group_size = row_group_size
+        self.csv_export = csv_export
+        self.buffer: list[Token] = []
+
+        legacy_csv = results_path(path, "csv")
+        if not path.exists() and legacy_csv.exists():
+            # The day was started in CSV mode; carry its rows over
+            write_results(path, read_results(legacy_csv))
+        elif not path.exists():
+            # Created up front, like a CSV header, so readers see the day at once
+            write_results(path, pl.DataFrame(schema=RESULTS_SCHEMA))
+        self.merge_parts()
+
+    def write(self, token: Token) -> list[Token]:
+        self.buffer.append(token)
+        if len(self.buffer) < self.row_group_size:
+            return []
+        return self.flush()
+
+    def flush(self) -> list[Token]:
+        if not self.buffer:
+            return []
+
+        committed, self.buffer = self.buffer, []
+        parts_dir = results_parts_dir(self.path)
+        parts_dir.mkdir(exist_ok=True)
+        parts = results_parts(self.path)
+        index = int(parts[-1].stem) + 1 if parts else 0
+        write_results(parts_dir / f"{index:06d}.parquet", tokens_to_frame(committed))
+
+        return committed
+
+    def close(self) -> list[Token]:
+        committed = self.flush()
+        self.merge_parts()
+        return committed
+
+    def merge_parts(self) -> None:
+        parts = results_parts(self.path)
+        if not parts:
+            return
+
+        existing = read_results(self.path)
+        new_rows = pl.concat([read_results(part) for part in parts])
+        # Parts already merged before an interrupted cleanup are skipped
+        frame = pl.concat(
+            [existing, new_rows.filter(~pl.col("mint").is_in(existing["mint"]))]
+        )
+
+        write_results(self.path, frame)
+        if self.csv_export:
+            write_results(results_path(self.path, "csv"), frame)
+
+        for part in parts:
+            part.unlink()
+        try:
+            results_parts_dir(self.path).rmdir()
+        except OSError:
+            pass
+
+
+def open_results_sink(
+    results_file: Path, results_format: ResultsFormat = "csv", csv_export: bool = False
+) -> ResultsSink:
+    if results_format == "parquet":
+        return ParquetResultsSink(
+            results_path(results_file, "parquet"), csv_export=csv_export
+        )
+    return CsvResultsSink(results_path(results_file, "csv"))
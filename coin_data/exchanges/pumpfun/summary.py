@@ -0,0 +1,150 @@
+import dataclasses
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.config import PUMPFUN_DATA_DIR, PUMPFUN_SUMMARY_PATH
+from coin_data.exchanges.pumpfun.sinks import (
+    read_results,
+    results_files,
+    source_signature,
+)
+from coin_data.logging import logger
+
+SUMMARY_VERSION = 1
+SUMMARY_COLUMNS = ["mint", "current_market_cap", "highest_market_cap"]
+
+
+@dataclass(slots=True)
+class DaySummary:
+    """Aggregates for one day's results file."""
+
+    date: str
+    file: str
+    rows: int
+    # [size, mtime_ns] of the results file when it was summarized
+    source: list[int] = field(default_factory=list)
+    total_market_cap: float = 0.0
+    median_market_cap: float | None = None
+    max_market_cap: float | None = None
+    max_highest_market_cap: float | None = None
+
+
+@dataclass(slots=True)
+class SummaryManifest:
+    days: dict[str, DaySummary] = field(default_factory=dict)
+    version: int = SUMMARY_VERSION
+
+    @classmethod
+    def load(cls, path: Path = PUMPFUN_SUMMARY_PATH) -> "SummaryManifest":
+        if not path.exists():
+            return cls()
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+
+        if data.get("version") != SUMMARY_VERSION:
+            return cls()
+
+        return cls(
+            days={date: DaySummary(**value) for date, value in data["days"].items()}
+        )
+
+    def save(self, path: Path = PUMPFUN_SUMMARY_PATH) -> None:
+        tmp_file = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(dataclasses.asdict(self), f)
+        os.replace(tmp_file, path)
+
+    def frame(self) -> pl.DataFrame:
+        """One row per day, sorted by date, with a `cumulative_count` column."""
+        return (
+            pl.DataFrame(
+                [dataclasses.asdict(day) for day in self.days.values()],
+                schema={
+                    "date": pl.Utf8,
+                    "rows": pl.Int64,
+                    "total_market_cap": pl.Float64,
+                    "median_market_cap": pl.Float64,
+                    "max_market_cap": pl.Float64,
+                    "max_highest_market_cap": pl.Float64,
+                },
+            )
+            .with_columns(pl.col("date").str.to_date())
+            .sort("date")
+            .with_columns(pl.col("rows").cum_sum().alias("cumulative_count"))
+        )
+
+
+def summarize_day(path: Path) -> DaySummary:
+    """Aggregate a results file, reading only the columns it needs."""
+    stats = (
+        read_results(path, SUMMARY_COLUMNS)
+        .select(
+            pl.len().alias("rows"),
+            pl.col("current_market_cap").sum().alias("total_market_cap"),
+            pl.col("current_market_cap").median().alias("median_market_cap"),
+            pl.col("current_market_cap").max().alias("max_market_cap"),
+            pl.col("highest_market_cap").max().alias("max_highest_market_cap"),
+        )
+        .row(0, named=True)
+    )
+
+    return DaySummary(
+        date=path.stem.removeprefix("results_"),
+        file=path.name,
+        source=source_signature([path]).get(path.name, []),
+        **stats,
+    )
+
+
+def update_summary(
+    data_dir: Path = PUMPFUN_DATA_DIR, path: Path = PUMPFUN_SUMMARY_PATH
+) -> int:
+    """
+    Bring the summary in line with the results files in `data_dir`. Only
+    days whose file changed since they were summarized are read again.
+    Returns the number of days updated.
+    """
+    manifest = SummaryManifest.load(path)
+    paths = {
+        results_file.stem: results_file for results_file in results_files(data_dir)
+    }
+    signature = source_signature(paths.values())
+
+    updated = 0
+    for stem, results_file in paths.items():
+        date = stem.removeprefix("results_")
+        current = manifest.days.get(date)
+        if (
+            current is not None
+            and current.file == results_file.name
+            and current.source == signature.get(results_file.name)
+        ):
+            continue
+
+        try:
+            manifest.days[date] = summarize_day(results_file)
+        except pl.exceptions.PolarsError as e:
+            logger.warning(f"⚠️ Could not summarize {results_file.name}: {e}")
+            continue
+        updated += 1
+
+    removed = [date for date in manifest.days if f"results_{date}" not in paths]
+    for date in removed:
+        del manifest.days[date]
+
+    if updated or removed or not path.exists():
+        manifest.save(path)
+
+    return updated
+
+
+def load_summary(path: Path = PUMPFUN_SUMMARY_PATH) -> pl.DataFrame:
+    return SummaryManifest.load(path).frame()
@@ -1,15 +1,15 @@
-import csv
 import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from io import StringIO
-from typing import Tuple
+from typing import Iterator, Tuple
 
+import polars as pl
 import pytz
 
 from coin_data.exchanges.solscan import SOLSCAN_BASE_URL, SOLSCAN_EXPORT_ENDPOINT
 from coin_data.logging import logger
 from coin_data.requests import APIRequest
+from coin_data.utils.mint_key import is_valid_mint
 
 EST = pytz.timezone("America/New_York")
 PUMPFUN_RAYDIUM_MIGRATION = "39azUYFWPz3VHgKCf3VChUwbpURdCHRxjWVowf5jUJjg"
@@ -17,6 +17,21 @@ ACTIVITY_SPL_TRANSFER = "ACTIVITY_SPL_TRANSFER"
 RAYDIUM_AUTHORITY_V4 = "5Q544fKrFoe6tsEbD7S8EmxGTJYAKtTVhAW5Q5pge4j1"
 WSOL = "So11111111111111111111111111111111111111112"
 
+# Export column -> `Transaction` field, in field order
+TRANSACTION_COLUMNS = {
+    "Signature": "signature",
+    "Time": "time",
+    "Action": "action",
+    "From": "sender",
+    "To": "receiver",
+    "Amount": "amount",
+    "Flow": "flow",
+    "Value": "value",
+    "Decimals": "decimals",
+    "TokenAddress": "token_address",
+}
+TRANSACTION_BATCH_SIZE = 500
+
 
 @dataclass
 class Transaction:
@@ -105,68 +120,68 @@ class PumpfunTokenDataExplorer:
             return response.body
 
     def convert_csv_to_json(self, csv_data: str) -> str:
-        csv_file = StringIO(csv_data)
-        reader = csv.DictReader(csv_file)
-        transactions = [row for row in reader]
-        return json.dumps(transactions, indent=2)
-
-    def convert_csv_to_dict(self, csv_data: str) -> list[Transaction]:
+        frame = pl.read_csv(csv_data.encode(), infer_schema=False)
+        return json.dumps(frame.to_dicts(), indent=2)
+
+    def convert_csv_to_frame(self, csv_data: str) -> pl.DataFrame:
+        """
+        Parse the export into a frame with one string column per
+        `Transaction` field, dropping incomplete rows and rows whose token
+        address is not a valid mint.
+        """
         if not csv_data.strip():
             raise ValueError("CSV data is empty.")
 
-        transactions: list[Transaction] = []
-        # List of fields that must be present in each row.
-        required_fields = [
-            "Signature",
-            "Time",
-            "Action",
-            "From",
-            "To",
-            "Amount",
-            "Flow",
-            "Value",
-            "Decimals",
-            "TokenAddress",
-        ]
-
         try:
-            csv_file = StringIO(csv_data)
-            reader = csv.DictReader(csv_file)
+            frame = pl.read_csv(
+                csv_data.encode(),
+                columns=list(TRANSACTION_COLUMNS),
+                infer_schema=False,
+            )
         except Exception as e:
             raise ValueError("Failed to parse CSV data.") from e
 
-        # Process each row from the CSV.
-        for row_num, row in enumerate(
-            reader, start=2
-        ):  # start=2 to account for the header row.
-            # Ensure all required fields exist and are not empty.
-            if not all(row.get(field, "").strip() for field in required_fields):
-                logger.warning(
-                    f"Row {row_num} skipped: missing one or more required fields."
-                )
-                continue
-
-            try:
-                # Convert field values as needed.
-                transaction = Transaction(
-                    signature=row["Signature"],
-                    time=row["Time"],
-                    action=row["Action"],
-                    sender=row["From"],
-                    receiver=row["To"],
-                    amount=row["Amount"],
-                    flow=row["Flow"],
-                    value=row["Value"],
-                    decimals=row["Decimals"],
-                    token_address=row["TokenAddress"],
-                )
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Row {row_num} skipped due to conversion error: {e}")
-                continue
-
-            transactions.append(transaction)
-
-        return transactions
+        complete = frame.filter(
+            pl.all_horizontal(
+                pl.col(column).str.strip_chars().str.len_bytes() > 0
+                for column in TRANSACTION_COLUMNS
+            )
+        )
+        if complete.height < frame.height:
+            logger.warning(
+                f"{frame.height - complete.height} rows skipped: "
+                "missing one or more required fields."
+            )
+
+        # Validate each distinct address once, not once per row
+        addresses = complete["TokenAddress"].unique()
+        invalid = [address for address in addresses if not is_valid_mint(address)]
+        if invalid:
+            logger.warning(f"Rows skipped: invalid token addresses {invalid}.")
+            complete = complete.filter(~pl.col("TokenAddress").is_in(invalid))
+
+        return complete.select(
+            pl.col(column).alias(field) for column, field in TRANSACTION_COLUMNS.items()
+        )
+
+    @staticmethod
+    def unique_mints(frame: pl.DataFrame) -> pl.DataFrame:
+        """First transfer of each mint; the pipeline needs one row per token."""
+        return frame.unique(subset="token_address", keep="first", maintain_order=True)
+
+    @classmethod
+    def iter_transaction_batches(
+        cls, frame: pl.DataFrame, batch_size: int = TRANSACTION_BATCH_SIZE
+    ) -> Iterator[list[Transaction]]:
+        for batch in frame.iter_slices(batch_size):
+            yield cls.convert_frame_to_transactions(batch)
+
+    @staticmethod
+    def convert_frame_to_transactions(frame: pl.DataFrame) -> list[Transaction]:
+        return [Transaction(*row) for row in frame.iter_rows()]
+
+    def convert_csv_to_dict(self, csv_data: str) -> list[Transaction]:
+        return self.convert_frame_to_transactions(self.convert_csv_to_frame(csv_data))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+import polars as pl
+
+from coin_data.config import PUMPFUN_DATA_DIR, PUMPFUN_UNIVERSE_PATH
+from coin_data.exchanges.pumpfun.sinks import (
+    RESULTS_SCHEMA,
+    read_results,
+    results_files,
+    source_signature,
+)
+from coin_data.logging import logger
+
+UNIVERSE_SCHEMA = {"date": pl.Date(), **RESULTS_SCHEMA}
+
+UniverseVersion = tuple[int, int, int]
+
+
+def universe_sources_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+def build_universe(paths: list[Path]) -> pl.DataFrame:
+    frames = [
+        read_results(path).with_columns(
+            pl.lit(path.stem.removeprefix("results_")).str.to_date().alias("date")
+        )
+        for path in paths
+    ]
+    if not frames:
+        return pl.DataFrame(schema=UNIVERSE_SCHEMA)
+
+    return pl.concat(frames).select(list(UNIVERSE_SCHEMA)).sort("date")
+
+
+def load_universe_sources(path: Path) -> dict[str, list[int]] | None:
+    """The results signature the published universe was built from."""
+    try:
+        with open(universe_sources_path(path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def publish_universe(
+    data_dir: Path = PUMPFUN_DATA_DIR,
+    path: Path = PUMPFUN_UNIVERSE_PATH,
+    force: bool = False,
+) -> bool:
+    """
+    Write every results file into one uncompressed Arrow IPC file and swap
+    it in atomically. Readers that already mapped the previous file keep
+    their view. Only days whose results file changed are read again; the
+    rest are carried over from the previous file. Skipped when no results
+    file changed; returns whether a new file was published.
+    """
+    paths = results_files(data_dir)
+    signature = source_signature(paths)
+    sources_path = universe_sources_path(path)
+    previous = None if force or not path.exists() else load_universe_sources(path)
+
+    if previous == signature:
+        return False
+
+    previous = previous or {}
+    changed = [p for p in paths if previous.get(p.name) != signature[p.name]]
+    unchanged_days = [
+        p.stem.removeprefix("results_") for p in paths if p not in changed
+    ]
+
+    universe = build_universe(changed)
+    if unchanged_days:
+        unchanged = load_universe(path).filter(
+            pl.col("date").is_in(pl.Series(unchanged_days).str.to_date())
+        )
+        universe = pl.concat([unchanged, universe]).sort("date", maintain_order=True)
+
+    # Uncompressed, so readers can memory-map the buffers as they are
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    universe.write_ipc(tmp_file, compression="uncompressed")
+    os.replace(tmp_file, path)
+
+    tmp_sources = sources_path.with_suffix(".json.tmp")
+    with open(tmp_sources, "w", encoding="utf-8") as f:
+        json.dump(signature, f)
+    os.replace(tmp_sources, sources_path)
+
+    logger.info(
+        f"🌐 Published token universe: {universe.height} tokens from {len(paths)} "
+        f"days ({len(changed)} rebuilt)"
+    )
+
+    return True
+
+
+def universe_is_current(
+    data_dir: Path = PUMPFUN_DATA_DIR, path: Path = PUMPFUN_UNIVERSE_PATH
+) -> bool:
+    """Whether the published universe was built from the current results."""
+    sources = load_universe_sources(path)
+    return (
+        sources is not None
+        and path.exists()
+        and sources == source_signature(results_files(data_dir))
+    )
+
+
+def universe_version(path: Path = PUMPFUN_UNIVERSE_PATH) -> UniverseVersion | None:
+    """Changes whenever a new universe is swapped in."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def load_universe(
+    path: Path = PUMPFUN_UNIVERSE_PATH, columns: list[str] | None = None
+) -> pl.DataFrame:
+    """Memory-map the universe; pages are shared with every other reader."""
+    return pl.read_ipc(path, columns=columns, memory_map=True)
+
+
+def scan_universe(path: Path = PUMPFUN_UNIVERSE_PATH) -> pl.LazyFrame:
+    return pl.scan_ipc(path, memory_map=True)
+
+
+class UniverseReader:
+    """
+    Per-process handle on the published universe. The mapped frame is
+    reused until the publisher swaps in a new file.
+    """
+
+    def __init__(self, path: Path = PUMPFUN_UNIVERSE_PATH) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.version: UniverseVersion | None = None
+        self.universe: pl.DataFrame | None = None
+        self.sources: dict[str, list[int]] = {}
+
+    def frame(self) -> pl.DataFrame | None:
+        """The current universe, or None if nothing was published yet."""
+        version = universe_version(self.path)
+        if version is None:
+            return None
+
+        with self.lock:
+            if version != self.version:
+                self.universe = load_universe(self.path)
+                self.version = version
+                self.sources = load_universe_sources(self.path) or {}
+
+            return self.universe
+
+    def results_for(self, results_file: Path) -> pl.DataFrame | None:
+        """
+        A day's rows, if the universe was built from the current version of
+        its results file; otherwise None and the file should be read.
+        """
+        universe = self.frame()
+        if universe is None or not results_file.exists():
+            return None
+
+        if self.sources.get(results_file.name) != source_signature([results_file]).get(
+            results_file.name
+        ):
+            return None
+
+        day = results_file.stem.removeprefix("results_")
+        return universe.filter(pl.col("date") == pl.lit(day).str.to_date()).drop("date")
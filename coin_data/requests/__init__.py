@@ -5,7 +5,7 @@ import ssl
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
 from types import TracebackType
-from typing import Any, Optional, Type
+from typing import Any, Iterator, Optional, Type
 from urllib.parse import urlparse
 
 from python_socks.sync import Proxy
@@ -303,9 +303,6 @@ class APIRequest:
         json_data: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
     ) -> APIResponse:
-        if self.conn is None:
-            raise ValueError("Connection is not initialized")
-
         url = build_url(endpoint, params)
         req_headers = build_headers(headers)
         body = json.dumps(json_data) if json_data else data
@@ -313,6 +310,23 @@ class APIRequest:
         if json_data and HEADER_CONTENT_TYPE not in req_headers:
             req_headers[HEADER_CONTENT_TYPE] = JSON_CONTENT_TYPE
 
+        response = self._send(method, url, body, req_headers)
+        if isinstance(response, APIResponse):
+            return response
+
+        return self._handle_response(response)
+
+    def _send(
+        self, method: str, url: str, body: Optional[str], headers: dict[str, str]
+    ) -> http.client.HTTPResponse | APIResponse:
+        """
+        Send a request and return the response once its headers are read,
+        retrying through the other proxies on connection errors. Returns an
+        `APIResponse` with status 0 when every attempt failed.
+        """
+        if self.conn is None:
+            raise ValueError("Connection is not initialized")
+
         attempt = 0
         max_attempts = len(PROXIES) if PROXIES_ENABLED else 1
 
@@ -327,9 +341,8 @@ class APIRequest:
                     if self.proxy_host and self.proxy_host.startswith("http"):
                         self.conn.set_tunnel(host)
 
-                self.conn.request(method, url, body=body, headers=req_headers)
-                response = self.conn.getresponse()
-                return self._handle_response(response)
+                self.conn.request(method, url, body=body, headers=headers)
+                return self.conn.getresponse()
             except (ConnectionRefusedError, TimeoutError, OSError) as err:
                 logger.warning(
                     f"Proxy {self.proxy_host}:{self.proxy_port} failed: {err}"
@@ -355,6 +368,39 @@ class APIRequest:
     ) -> APIResponse:
         return self.request("GET", endpoint, params=params, headers=headers)
 
+    def iter_lines(
+        self,
+        endpoint: str,
+        params: Optional[list[tuple[str, str]]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream a GET response body line by line. Connection errors are
+        retried through the other proxies, as in `request`.
+
+        Closing the generator before the body is exhausted closes the
+        connection, so the remainder is never read off the socket.
+        """
+        url = build_url(endpoint, params)
+        response = self._send("GET", url, None, build_headers(headers))
+        if isinstance(response, APIResponse):
+            raise ConnectionError(response.error)
+
+        try:
+            if response.status >= 400:
+                raise Exception(
+                    response.reason
+                    or HTTP_ERROR_FORMAT.format(status_code=response.status)
+                )
+
+            while line := response.readline():
+                yield line
+        finally:
+            if not response.isclosed():
+                # A partially read response cannot be reused on this connection
+                response.close()
+                self.close()
+
     def post(
         self,
         endpoint: str,
@@ -7,6 +7,8 @@ from coin_data.server.contracts import get_contracts_batch
 from coin_data.server.health import health_check
 from coin_data.server.home import home
 from coin_data.server.logger import CustomLoggingConfig
+from coin_data.server.thumbnails import get_thumbnail
+from coin_data.server.tokens import get_token, list_tokens
 from coin_data.server.twitter_api import get_twitter_data
 from coin_data.server.websocket_proxy import websocket_proxy
 
@@ -29,6 +31,9 @@ app = Litestar(
         get_contracts_batch,
         websocket_proxy,
         get_twitter_data,
+        get_token,
+        list_tokens,
+        get_thumbnail,
     ],
     logging_config=CustomLoggingConfig(),
 )
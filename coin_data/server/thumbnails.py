@@ -0,0 +1,210 @@
+import asyncio
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+import httpx
+import picologging as logging
+from litestar import Response, get
+from litestar.exceptions import HTTPException, ValidationException
+from litestar.status_codes import HTTP_502_BAD_GATEWAY
+
+from coin_data.config import (
+    THUMBNAIL_CACHE_DIR,
+    THUMBNAIL_CACHE_MAX_BYTES,
+    THUMBNAIL_SIZE,
+)
+from coin_data.exchanges.pumpfun.constants import (
+    IPFS_GATEWAY_URL,
+    IPFS_PATH_PATTERN,
+    PINATA_GATEWAY_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZES = (THUMBNAIL_SIZE,)
+THUMBNAIL_MAX_SOURCE_BYTES = 10 * 1024 * 1024
+THUMBNAIL_FETCH_TIMEOUT = 15.0
+# Thumbnails never change for a given URI and size
+THUMBNAIL_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Only images on these gateways are fetched, so the endpoint is no open proxy
+THUMBNAIL_SOURCE_PREFIXES = (IPFS_GATEWAY_URL, PINATA_GATEWAY_URL)
+IPFS_PATH_REGEX = re.compile(IPFS_PATH_PATTERN)
+
+
+def thumbnail_key(path: str, size: int) -> str:
+    return hashlib.sha256(f"{size}:{path}".encode()).hexdigest()
+
+
+def ipfs_path(uri: str) -> str | None:
+    """The CID path of an image on a known IPFS gateway, or None."""
+    if not uri.startswith(THUMBNAIL_SOURCE_PREFIXES):
+        return None
+
+    path = uri.removeprefix(IPFS_GATEWAY_URL).removeprefix(PINATA_GATEWAY_URL)
+    path = path.split("?")[0].split("#")[0]
+    return path if IPFS_PATH_REGEX.fullmatch(path) else None
+
+
+def thumbnail_source_url(path: str, size: int) -> str:
+    """IPFS images are downscaled by the Pinata gateway."""
+    return f"{PINATA_GATEWAY_URL}{path}?img-width={size}&img-height={size}"
+
+
+async def fetch_image(path: str, size: int) -> tuple[bytes, str]:
+    """
+    Download the gateway's thumbnail of an IPFS image. Redirects are not
+    followed, and the body is read in chunks and abandoned once it passes
+    `THUMBNAIL_MAX_SOURCE_BYTES`.
+    """
+    unusable = HTTPException(
+        status_code=HTTP_502_BAD_GATEWAY, detail=f"No usable image at {path}"
+    )
+    try:
+        async with (
+            httpx.AsyncClient(timeout=THUMBNAIL_FETCH_TIMEOUT) as client,
+            client.stream("GET", thumbnail_source_url(path, size)) as response,
+        ):
+            media_type = response.headers.get("content-type", "").split(";")[0].strip()
+            content_length = response.headers.get("content-length", "")
+            if (
+                response.status_code != 200
+                or not media_type.startswith("image/")
+                or (
+                    content_length.isdigit()
+                    and int(content_length) > THUMBNAIL_MAX_SOURCE_BYTES
+                )
+            ):
+                raise unusable
+
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                if len(content) > THUMBNAIL_MAX_SOURCE_BYTES:
+                    raise unusable
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=HTTP_502_BAD_GATEWAY, detail=f"Image fetch failed: {e}"
+        ) from e
+
+    return bytes(content), media_type
+
+
+class ThumbnailCache:
+    """
+    Size-bounded LRU of thumbnails on disk, one file per key holding the
+    media type on its first line. A hit touches the file's mtime, and
+    eviction removes the least recently used files first.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.total_bytes: int | None = None
+        # One upstream fetch per key at a time
+        self.locks: dict[str, asyncio.Lock] = {}
+        # `put` runs in worker threads; guards `total_bytes` and eviction
+        self.write_lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        path = self.directory / key
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        media_type, _, content = data.partition(b"\n")
+        return content, media_type.decode()
+
+    def put(self, key: str, content: bytes, media_type: str) -> None:
+        with self.write_lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self.entries())
+
+            path = self.directory / key
+            tmp_file = path.with_suffix(".tmp")
+            data = media_type.encode() + b"\n" + content
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, path)
+
+            self.total_bytes += len(data)
+            if self.total_bytes > self.max_bytes:
+                self.evict()
+
+    def entries(self) -> list[tuple[int, int, Path]]:
+        """(mtime_ns, size, path) of every cached file, oldest first."""
+        entries: list[tuple[int, int, Path]] = []
+        for path in self.directory.iterdir():
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self) -> None:
+        """Remove the least recently used files until under 90% of the limit."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes * 0.9:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        self.total_bytes = total
+        logger.info(f"Evicted thumbnails down to {total} bytes")
+
+    async def fetch(self, path: str, size: int) -> tuple[bytes, str]:
+        """
+        The cached thumbnail, fetched upstream on a miss. Disk access runs in
+        worker threads so it never blocks the event loop.
+        """
+        key = thumbnail_key(path, size)
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            return cached
+
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have fetched it while this one waited
+                cached = await asyncio.to_thread(self.get, key)
+                if cached is not None:
+                    return cached
+
+                content, media_type = await fetch_image(path, size)
+                await asyncio.to_thread(self.put, key, content, media_type)
+                return content, media_type
+        finally:
+            # A later request may have replaced the lock after this one's
+            # waiters finished; leave that one in place
+            if self.locks.get(key) is lock:
+                del self.locks[key]
+
+
+thumbnail_cache = ThumbnailCache(THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES)
+
+
+@get("/thumbnails")
+async def get_thumbnail(uri: str, size: int = THUMBNAIL_SIZE) -> Response[bytes]:
+    """A token image at dashboard size, fetched once and then served from disk."""
+    if size not in THUMBNAIL_SIZES:
+        raise ValidationException(detail=f"Unsupported thumbnail size: {size}")
+    # Only IPFS images, keyed by CID so every gateway's URI shares an entry
+    path = ipfs_path(uri)
+    if path is None:
+        raise ValidationException(detail=f"Invalid image URI: {uri}")
+
+    content, media_type = await thumbnail_cache.fetch(path, size)
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Cache-Control": THUMBNAIL_CACHE_CONTROL},
+    )
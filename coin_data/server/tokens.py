@@ -0,0 +1,60 @@
+import datetime
+from typing import Any
+
+import polars as pl
+from litestar import get
+from litestar.exceptions import NotFoundException, ValidationException
+
+from coin_data.exchanges.pumpfun.compaction import find_token, scan_results
+from coin_data.exchanges.pumpfun.universe import UniverseReader
+from coin_data.utils.mint_key import is_valid_mint
+
+# Shared by every request in this worker; the file itself is shared by all
+universe_reader = UniverseReader()
+
+
+@get("/tokens/{mint:str}")
+async def get_token(mint: str) -> dict[str, Any]:
+    """Scraped results for a single graduated token."""
+    if not is_valid_mint(mint):
+        raise ValidationException(detail=f"Invalid mint address: {mint}")
+
+    universe = universe_reader.frame()
+    rows = (
+        pl.DataFrame() if universe is None else universe.filter(pl.col("mint") == mint)
+    )
+    if rows.is_empty():
+        # Not published yet, or scraped since; look it up in the partitions
+        rows = find_token(mint)
+    if rows.is_empty():
+        raise NotFoundException(detail=f"Token not found: {mint}")
+
+    return rows.row(0, named=True)
+
+
+@get("/tokens")
+async def list_tokens(
+    date: str | None = None, limit: int = 100, offset: int = 0
+) -> list[dict[str, Any]]:
+    """Graduated tokens, optionally for a single YYYY-MM-DD day."""
+    if limit < 1:
+        raise ValidationException(detail=f"Invalid limit: {limit}")
+    if offset < 0:
+        raise ValidationException(detail=f"Invalid offset: {offset}")
+
+    if date is not None:
+        try:
+            day = datetime.date.fromisoformat(date)
+        except ValueError as e:
+            raise ValidationException(detail=f"Invalid date: {date}") from e
+
+    universe = universe_reader.frame()
+    if universe is None:
+        # Not published yet; page through the compacted partitions instead
+        tokens = scan_results(date, date)
+    elif date is not None:
+        tokens = universe.lazy().filter(pl.col("date") == day)
+    else:
+        tokens = universe.lazy()
+
+    return tokens.slice(offset, min(limit, 1000)).collect().to_dicts()
@@ -0,0 +1,69 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings or bytes, using double hashing of a
+    single blake2b digest. Serializes to bytes for on-disk sidecars.
+    """
+
+    def __init__(self, size_bits: int, hash_count: int, bits: bytes | None = None):
+        self.size_bits = max(8, size_bits)
+        self.hash_count = max(1, hash_count)
+        self.bits = bytearray(bits) if bits else bytearray((self.size_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(
+        cls, capacity: int, false_positive_rate: float = 0.01
+    ) -> "BloomFilter":
+        capacity = max(1, capacity)
+        size_bits = math.ceil(
+            -capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        hash_count = round(size_bits / capacity * math.log(2))
+        return cls(size_bits, hash_count)
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[str | bytes], false_positive_rate: float = 0.01
+    ) -> "BloomFilter":
+        items = list(items)
+        bloom = cls.for_capacity(len(items), false_positive_rate)
+        bloom.update(items)
+        return bloom
+
+    def _positions(self, item: str | bytes) -> Iterable[int]:
+        data = item.encode() if isinstance(item, str) else item
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        return ((h1 + i * h2) % self.size_bits for i in range(self.hash_count))
+
+    def add(self, item: str | bytes) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, items: Iterable[str | bytes]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str | bytes) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def to_bytes(self) -> bytes:
+        header = self.size_bits.to_bytes(8, "little") + self.hash_count.to_bytes(
+            2, "little"
+        )
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        size_bits = int.from_bytes(data[:8], "little")
+        hash_count = int.from_bytes(data[8:10], "little")
+        return cls(size_bits, hash_count, data[10:])
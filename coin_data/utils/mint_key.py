@@ -0,0 +1,75 @@
+from typing import Iterable
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+MINT_KEY_SIZE = 32  # Solana public keys are 32 bytes
+
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+
+def decode_mint(address: str) -> bytes:
+    """
+    Decode a base58 Solana address into its 32-byte key.
+    Raises ValueError for anything that is not a 32-byte base58 address.
+    """
+    if not 32 <= len(address) <= 44:
+        raise ValueError(f"Invalid mint address length: {address!r}")
+
+    value = 0
+    try:
+        for char in address:
+            value = value * 58 + _BASE58_INDEX[char]
+    except KeyError:
+        raise ValueError(f"Invalid base58 character in mint address: {address!r}")
+
+    # Each leading "1" encodes a leading zero byte
+    leading_zeros = len(address) - len(address.lstrip("1"))
+    body_size = MINT_KEY_SIZE - leading_zeros
+    if body_size < 0 or value.bit_length() > 8 * body_size:
+        raise ValueError(f"Mint address does not decode to 32 bytes: {address!r}")
+
+    key = value.to_bytes(body_size, "big")
+    if leading_zeros < MINT_KEY_SIZE and key[:1] == b"\x00":
+        # Zero bytes beyond the leading "1"s would be encoded as more "1"s
+        raise ValueError(f"Mint address does not decode to 32 bytes: {address!r}")
+
+    return b"\x00" * leading_zeros + key
+
+
+def encode_mint(key: bytes) -> str:
+    """Encode a 32-byte key back into its base58 address."""
+    if len(key) != MINT_KEY_SIZE:
+        raise ValueError(f"Mint key must be {MINT_KEY_SIZE} bytes, got {len(key)}")
+
+    value = int.from_bytes(key, "big")
+    chars: list[str] = []
+    while value:
+        value, remainder = divmod(value, 58)
+        chars.append(BASE58_ALPHABET[remainder])
+
+    leading_zeros = len(key) - len(key.lstrip(b"\x00"))
+    return "1" * leading_zeros + "".join(reversed(chars))
+
+
+def is_valid_mint(address: str) -> bool:
+    try:
+        decode_mint(address)
+    except ValueError:
+        return False
+    return True
+
+
+def decode_mints(addresses: Iterable[str], strict: bool = False) -> list[bytes]:
+    """Decode many addresses, dropping invalid ones unless `strict`."""
+    keys: list[bytes] = []
+    for address in addresses:
+        try:
+            keys.append(decode_mint(address))
+        except ValueError:
+            if strict:
+                raise
+
+    return keys
+
+
+def encode_mints(keys: Iterable[bytes]) -> list[str]:
+    return [encode_mint(key) for key in keys]
@@ -1,18 +1,29 @@
+from pathlib import Path
+
 import polars as pl
 
+from coin_data.exchanges.pumpfun.sinks import read_results
 from coin_data.logging import logger
+from coin_data.utils.mint_key import decode_mints, encode_mints, is_valid_mint
 
 activities_path = ""
 results_path = ""
 
-activities_df = pl.read_csv(activities_path)
-results_df = pl.read_csv(results_path)
+activities_df = pl.read_csv(activities_path, columns=["TokenAddress"])
+results_df = read_results(Path(results_path), columns=["mint"])
 
-# Extract unique token addresses from both datasets
-activities_tokens = set(activities_df["TokenAddress"].to_list())
-results_tokens = set(results_df["mint"].to_list())
+# Compare unique token addresses as 32-byte keys
+activities_addresses = activities_df["TokenAddress"].unique().to_list()
+invalid_tokens = [
+    address for address in activities_addresses if not is_valid_mint(address)
+]
+activities_tokens = set(decode_mints(activities_addresses))
+results_tokens = set(decode_mints(results_df["mint"].unique().to_list()))
 
 # Find missing tokens
-missing_tokens = activities_tokens - results_tokens
+missing_tokens = encode_mints(activities_tokens - results_tokens)
+
+if invalid_tokens:
+    logger.warning(f"Invalid token addresses: {invalid_tokens}")
 
 logger.info(f"Missing tokens: {missing_tokens}")